@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Precompiled animations for the windowed colour displays, for content that
+is looped over and over, such as an idle animation.
+"""
+
+import struct
+from time import monotonic, sleep
+
+from PIL import Image
+
+import luma.lcd.encoder
+import luma.lcd.framebuffer
+import luma.lcd.planner
+
+__all__ = ["animation"]
+
+
+_MAGIC = b"LUMAANIM"
+_VERSION = 1
+
+# Header: magic, version, display width & height, rotation, window offsets,
+# pixel format, frame rate, number of steps
+_HEADER = struct.Struct(">8sBHHBhhB4sdH")
+# Step: number of window updates
+_STEP = struct.Struct(">H")
+# Window update: bounding box, address window and the length of the data
+_UPDATE = struct.Struct(">4H4HI")
+
+# An arbitrary colour, whose encoding identifies the device's pixel format
+_PIXEL_PROBE = (0x12, 0x34, 0x56)
+
+
+def _configuration(device):
+    """
+    The parts of the device's set up that the encoded updates depend on:
+    its size, rotation, window offsets and pixel format (as the encoding of
+    a single, arbitrary, pixel).
+    """
+    width, height = device.size
+    h_offset, v_offset = device.apply_offsets((0, 0, 0, 0))[:2]
+    pixel = device.encode_pixels(Image.new(device.mode, (1, 1), _PIXEL_PROBE))
+    return (width, height, device.rotate, h_offset, v_offset, len(pixel), pixel)
+
+
+def _read(fp, size):
+    data = fp.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated animation")
+    return data
+
+
+class animation(object):
+    """
+    A looping sequence of frames, compiled by :py:meth:`compile` into the
+    window updates that take the display from each frame to the next,
+    already encoded for the device. Playing it back with :py:meth:`play`
+    then needs no image conversion, diffing or encoding at all.
+
+    The updates for the first frame are kept twice: in full, to start from
+    whatever was on display, and as the changes from the last frame, to wrap
+    around when looping.
+
+    :param device: The device the animation is played on.
+    :param steps: The encoded window updates (each a list of
+        :py:class:`luma.lcd.encoder.encoded_frame`) for the first frame in
+        full, followed by those for each frame as the changes from the one
+        before, with the first frame (as a wrap from the last) coming last.
+    :type steps: list
+    :param fps: The frame rate to play at.
+    :type fps: float
+
+    .. versionadded:: 2.14.0
+    """
+
+    def __init__(self, device, steps, fps):
+        assert len(steps) >= 2
+        assert fps > 0
+        self.device = device
+        self.steps = steps
+        self.fps = fps
+
+    @classmethod
+    def compile(cls, device, frames, fps=10):
+        """
+        Compiles a sequence of frames, such as those of an animated GIF (see
+        :py:class:`PIL.ImageSequence.Iterator`), for a device.
+
+        :param device: The device to compile for: one of the windowed colour
+            displays.
+        :param frames: The frames, each the size of the device; they are
+            converted to the device's mode as needed.
+        :type frames: Iterable[PIL.Image.Image]
+        :param fps: The frame rate to play at.
+        :type fps: float
+        :rtype: luma.lcd.animation.animation
+        """
+        frames = [frame.convert(device.mode) for frame in frames]
+        assert frames
+        assert all(frame.size == device.size for frame in frames)
+
+        # Weigh the windows as the device itself would, where it plans them
+        planner = getattr(device, "planner", None)
+        if planner is not None:
+            planner = luma.lcd.planner.window_planner(
+                planner.overhead, planner.bytes_per_pixel, planner.max_regions)
+
+        framebuffer = luma.lcd.framebuffer.tile_diff()
+        steps = []
+        for frame in frames + frames[:1]:
+            bounding_boxes = [bbox for _, bbox in framebuffer.redraw(frame)]
+            if planner is not None:
+                bounding_boxes = planner.plan(bounding_boxes)
+            steps.append([
+                # The images are not kept, as the framebuffer would otherwise
+                # need patching with every update
+                device.encode(frame.crop(bbox), bbox[:2])._replace(image=None)
+                for bbox in bounding_boxes
+            ])
+        return cls(device, steps, fps)
+
+    def play(self, loops=1, fps=None):
+        """
+        Plays the animation, starting from the first frame, sleeping as
+        needed to keep to the frame rate. Frames are paced against a
+        running deadline, so time lost on one frame is made up on the next.
+
+        :param loops: The number of times to play the frames through, or
+            ``None`` to loop forever.
+        :type loops: int
+        :param fps: A frame rate to play at, other than the compiled one.
+        :type fps: float
+        """
+        interval = 1.0 / (fps or self.fps)
+        num_frames = len(self.steps) - 1
+        deadline = monotonic()
+
+        index = 0
+        shown = 0
+        while loops is None or shown < loops * num_frames:
+            for frame in self.steps[index]:
+                self.device.present(frame)
+            shown += 1
+            index = index % num_frames + 1
+
+            deadline += interval
+            delay = deadline - monotonic()
+            if delay > 0:
+                sleep(delay)
+
+    def save(self, fp):
+        """
+        Writes the compiled animation to a binary file, to be read back by
+        :py:meth:`load`.
+
+        :param fp: The file object, opened for writing in binary mode.
+        """
+        config = _configuration(self.device)
+        fp.write(_HEADER.pack(_MAGIC, _VERSION, *config, self.fps, len(self.steps)))
+        for step in self.steps:
+            fp.write(_STEP.pack(len(step)))
+            for frame in step:
+                fp.write(_UPDATE.pack(*frame.bbox, *frame.window, len(frame.data)))
+                fp.write(frame.data)
+
+    @classmethod
+    def load(cls, device, fp):
+        """
+        Reads an animation written by :py:meth:`save`, to play on a device
+        configured as the one it was compiled for.
+
+        :param device: The device to play on.
+        :param fp: The file object, opened for reading in binary mode.
+        :rtype: luma.lcd.animation.animation
+        :raises ValueError: If the file is not a compiled animation, is
+            truncated, or was compiled for a device with a different size,
+            rotation, window offsets or pixel format.
+        """
+        header = _HEADER.unpack(_read(fp, _HEADER.size))
+        magic, version = header[:2]
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a compiled animation")
+        config = header[2:9]
+        # The pixel encoding is padded out to the field's size
+        config = config[:6] + (config[6][:config[5]],)
+        if config != _configuration(device):
+            raise ValueError("Compiled for a differently configured display")
+        fps, num_steps = header[9:]
+
+        steps = []
+        for _ in range(num_steps):
+            num_updates, = _STEP.unpack(_read(fp, _STEP.size))
+            step = []
+            for _ in range(num_updates):
+                fields = _UPDATE.unpack(_read(fp, _UPDATE.size))
+                data = _read(fp, fields[8])
+                step.append(luma.lcd.encoder.encoded_frame(fields[0:4], fields[4:8], data, None))
+            steps.append(step)
+        return cls(device, steps, fps)
@@ -6,11 +6,17 @@
 class st7567(object):
     DISPLAYON = 0xAF
     DISPLAYOFF = 0xAE
+    NORMALDISPLAY = 0xA6
+    INVERTDISPLAY = 0xA7
+    DISPLAYALLON_RESUME = 0xA4
+    DISPLAYALLON = 0xA5
 
 
 class pcd8544(object):
     DISPLAYON = 0x0C
     DISPLAYOFF = 0x08
+    DISPLAYALLON = 0x09
+    INVERTDISPLAY = 0x0D
 
 
 class st7735(object):
@@ -41,6 +47,10 @@ class ht1621(object):
 class uc1701x(object):
     DISPLAYON = 0xAF
     DISPLAYOFF = 0xAE
+    NORMALDISPLAY = 0xA6
+    INVERTDISPLAY = 0xA7
+    DISPLAYALLON_RESUME = 0xA4
+    DISPLAYALLON = 0xA5
 
 
 class st7789(object):
@@ -34,16 +34,22 @@ Collection of serial interfaces to LCD devices.
 # As before, as soon as the with block completes, the canvas buffer is flushed
 # to the device
 
-from time import sleep
+from time import monotonic, sleep
+
+from PIL import Image
 
 from luma.core.lib import rpi_gpio
 from luma.core.device import device, parallel_device
+from luma.core.interface.parallel import bitbang_6800
 from luma.core.interface.serial import noop, pcf8574
+from luma.core.util import bytes_to_nibbles
 from luma.core.framebuffer import diff_to_previous
 import luma.core.error
 import luma.core.framebuffer
 import luma.lcd.const
 from luma.lcd.segment_mapper import dot_muncher
+import luma.lcd.encoder
+import luma.lcd.planner
 from luma.core.virtual import character
 from luma.core.bitmap_font import embedded_fonts
 
@@ -253,14 +259,26 @@ class pcd8544(backlit_device):
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
         represents 270° rotation.
     :type rotate: int
+    :param framebuffer: Framebuffering strategy: by default the full frame is
+        always sent, otherwise supply an instance of
+        :py:class:`luma.lcd.framebuffer.page_diff` to only send the columns
+        that changed within each bank.
+    :type framebuffer: luma.lcd.framebuffer.page_diff
+
+    A frame identical to the one last sent is not sent again; the number of
+    frames skipped this way is counted in :py:attr:`skipped_frames`.
     """
 
-    def __init__(self, serial_interface=None, rotate=0, **kwargs):
+    def __init__(self, serial_interface=None, rotate=0, framebuffer=None, **kwargs):
         super(pcd8544, self).__init__(luma.lcd.const.pcd8544, serial_interface, **kwargs)
         self.capabilities(84, 48, rotate)
+        self.framebuffer = framebuffer
+        self.skipped_frames = 0
+        self._last_buf = None
 
-        self._mask = [1 << (i // self._w) % 8 for i in range(self._w * self._h)]
-        self._offsets = [(self._w * (i // (self._w * 8))) + (i % self._w) for i in range(self._w * self._h)]
+        self._blanked = False
+        self._all_on = False
+        self._inverted = False
 
         self.contrast(0xB0)
         self.clear()
@@ -271,22 +289,163 @@ class pcd8544(backlit_device):
         Takes a 1-bit :py:mod:`PIL.Image` and dumps it to the PCD8544
         LCD display.
         """
+        self.present(self.encode(image))
+
+    def encode(self, image):
+        """
+        Encodes an image, such as a splash screen that is shown repeatedly,
+        into the display's native bank layout, once, ready for
+        :py:meth:`present`.
+
+        :param image: The full 1-bit image to encode.
+        :type image: PIL.Image.Image
+        :rtype: luma.lcd.encoder.encoded_frame
+
+        .. versionadded:: 2.14.0
+        """
         assert image.mode == self.mode
         assert image.size == self.size
 
-        image = self.preprocess(image)
+        # Rotation is folded into the packing, so there is no need to preprocess
+        bbox = (0, 0, self._w, self._h)
+        return luma.lcd.encoder.encoded_frame(
+            bbox, bbox, luma.lcd.encoder.pages(image, self.rotate), None)
+
+    def present(self, frame):
+        """
+        Sends a frame from :py:meth:`encode` to the display, as is (subject
+        to the framebuffer only sending the columns that changed).
+
+        :param frame: The encoded frame.
+        :type frame: luma.lcd.encoder.encoded_frame
+
+        .. versionadded:: 2.14.0
+        """
+        assert frame.bbox == (0, 0, self._w, self._h)
+        self._write_banks(frame.data)
+
+    def _write_banks(self, buf):
+        """
+        Sends the encoded bank buffer to the display, restricted to the column
+        spans that changed if a framebuffer strategy is in use.
+        """
+        if buf == self._last_buf:
+            self.skipped_frames += 1
+            return
+        self._last_buf = buf
+
+        # Addressing a run of columns takes two command bytes (Y & X address),
+        # while a full frame needs three, as it also resets the function set
+        spans = self.framebuffer.redraw(buf, self._w, 2, 3) if self.framebuffer else None
+
+        if spans is None:
+            self.command(0x20, 0x80, 0x40)
+            self.data(buf)
+        else:
+            view = memoryview(buf)
+            for bank, start, end in spans:
+                offset = bank * self._w
+                self.command(0x40 | bank, 0x80 | start)
+                self.data(view[offset + start:offset + end])
+
+    def fill_pages(self, pattern):
+        """
+        Fills every bank of the display memory with the same byte, without
+        building or encoding an image. Each byte holds a column of 8 pixels,
+        the least significant bit being the top-most, in the controller's own
+        (unrotated) layout.
+
+        :param pattern: The byte to fill with, ``0x00`` to clear every pixel
+            and ``0xFF`` to set every pixel.
+        :type pattern: int
+
+        .. versionadded:: 2.14.0
+        """
+        assert 0x00 <= pattern <= 0xFF
+        self._write_banks(bytes([pattern]) * (self._w * self._h // 8))
+
+    def clear(self):
+        """
+        Initializes the device memory with an empty (blank) image. Every page
+        is always written, even if the last frame sent was blank, so that
+        this can be used to resynchronise the display.
+
+        .. versionchanged:: 2.14.0
+            Filled through :py:meth:`fill_pages`.
+        """
+        self._last_buf = None
+        if self.framebuffer:
+            self.framebuffer.prev_buf = None
+        self.fill_pages(0x00)
+
+    def _display_control(self):
+        # The PCD8544 display modes are mutually exclusive, and all set
+        # through the same display control command
+        if self._blanked:
+            self.command(self._const.DISPLAYOFF)
+        elif self._all_on:
+            self.command(self._const.DISPLAYALLON)
+        elif self._inverted:
+            self.command(self._const.INVERTDISPLAY)
+        else:
+            self.command(self._const.DISPLAYON)
+
+    def show(self):
+        """
+        Sets the display mode ON, restoring inverse video if it was enabled.
+        """
+        self._blanked = False
+        self._display_control()
+
+    def hide(self):
+        """
+        Blanks the display.
+        """
+        self._blanked = True
+        self._display_control()
+
+    def invert(self, enabled):
+        """
+        Switches the display between normal and inverse video in hardware,
+        without affecting the display memory.
+
+        :param enabled: Set to ``True`` for inverse video, ``False`` for normal.
+        :type enabled: bool
+
+        .. versionadded:: 2.14.0
+        """
+        self._inverted = enabled
+        self._display_control()
+
+    def all_on(self, enabled):
+        """
+        Lights up every pixel in hardware, without affecting the display
+        memory, so the current contents reappear once switched back.
+
+        :param enabled: Set to ``True`` to light every pixel, ``False`` to
+            resume showing the display memory.
+        :type enabled: bool
 
-        self.command(0x20, 0x80, 0x40)
+        .. versionadded:: 2.14.0
+        """
+        self._all_on = enabled
+        self._display_control()
 
-        buf = bytearray(self._w * self._h // 8)
-        off = self._offsets
-        mask = self._mask
+    def blank(self, enabled):
+        """
+        Blanks the display in hardware, without affecting the display memory,
+        so the current contents reappear once unblanked.
 
-        for idx, pix in enumerate(image.getdata()):
-            if pix > 0:
-                buf[off[idx]] |= mask[idx]
+        :param enabled: Set to ``True`` to blank the display, ``False`` to
+            show the display memory again.
+        :type enabled: bool
 
-        self.data(list(buf))
+        .. versionadded:: 2.14.0
+        """
+        if enabled:
+            self.hide()
+        else:
+            self.show()
 
     def contrast(self, value):
         """
@@ -296,18 +455,270 @@ class pcd8544(backlit_device):
         self.command(0x21, 0x14, value | 0x80, 0x20)
 
 
-class st7789(backlit_device):
+class __framebuffer_mixin(object):
+    """
+    Helper class for initializing the framebuffer. Its only purpose is to
+    log a deprecation warning if a string framebuffer is specified.
+
+    .. note::
+        Specifying the framebuffer as a string will be removed at the next
+        major release, and hence this mixin will become redundant and will
+        also be removed at that point.
+    """
+
+    def init_framebuffer(self, framebuffer, default_num_segments):
+        if framebuffer is None:
+            self.framebuffer = diff_to_previous(num_segments=default_num_segments)
+        elif isinstance(framebuffer, str):
+            import warnings
+            warnings.warn(
+                "Specifying framebuffer as a string is now deprecated; Supply an instance of class full_frame() or diff_to_previous() instead",
+                DeprecationWarning
+            )
+            self.framebuffer = getattr(luma.core.framebuffer, framebuffer)()
+        else:
+            self.framebuffer = framebuffer
+
+
+class __madctl_mixin(object):
+    """
+    Helper class for the colour displays whose controllers can rotate their
+    own address space, through the row/column exchange (MV) and address
+    order (MX, MY) bits of Memory Access Control (36h).
+    """
+
+    def init_madctl(self, madctl, hardware_rotate):
+        """
+        Returns the MADCTL value to program, given its value for no rotation.
+        For a hardware rotation, the device is then redeclared in the rotated
+        address space, so that frames are sent as drawn rather than being
+        rotated by :py:meth:`preprocess`, and framebuffer bounding boxes map
+        directly onto the column and row addresses.
+        """
+        if not hardware_rotate:
+            return madctl
+
+        # Each 90° clockwise step exchanges rows and columns, reversing the
+        # order of whichever of the two was not previously exchanged
+        for _ in range(self.rotate):
+            if madctl & 0x20:
+                madctl = (madctl ^ 0x80) & ~0x20
+            else:
+                madctl = (madctl ^ 0x40) | 0x20
+
+        self.capabilities(self.width, self.height, 0, mode=self.mode)
+        return madctl
+
+
+class __window_mixin(object):
+    """
+    Helper class for the colour displays, which write to their memory
+    through an address window set up by ``set_window``.
+    """
+
+    # The most pixel data sent in a single write when filling, so that the
+    # full frame need never be held in memory
+    _FILL_CHUNK_SIZE = 4096
+
+    def _patch_framebuffer(self, bbox, source):
+        """
+        Updates the framebuffer's record of the previous frame, for a region
+        sent to the display other than through :py:meth:`display`. Without
+        a source image, the record is dropped, so the next frame is sent in
+        full.
+        """
+        framebuffer = self.framebuffer
+        if not hasattr(framebuffer, "prev_image"):
+            return
+        if source is None:
+            framebuffer.prev_image = None
+            return
+        if framebuffer.prev_image is None:
+            # Only a write of the whole display makes for a previous frame
+            if bbox != (0, 0, self._w, self._h):
+                return
+            framebuffer.prev_image = Image.new(self.mode, (self._w, self._h))
+        framebuffer.prev_image.paste(source, bbox)
+        if hasattr(framebuffer, "invalidate"):
+            framebuffer.invalidate(bbox)
+
+    def blit(self, image, xy):
+        """
+        Sends an image to just the matching region of the display, without
+        compositing and diffing the full frame. The framebuffer's record of
+        the previous frame is patched, so that later calls to
+        :py:meth:`display` still only send what differs from the display.
+
+        :param image: The image to send, in the same mode as the device.
+        :type image: PIL.Image.Image
+        :param xy: The top-left position on the display to send it to.
+        :type xy: tuple
+
+        .. versionadded:: 2.14.0
+        """
+        self.present(self.encode(image, xy))
+
+    def encode(self, image, xy=(0, 0)):
+        """
+        Encodes an image, such as a splash screen or an icon that is shown
+        repeatedly, into the display's native form, once: rotated, offset and
+        packed into its pixel format, ready for :py:meth:`present`.
+
+        :param image: The image to encode, in the same mode as the device.
+        :type image: PIL.Image.Image
+        :param xy: The top-left position on the display it is to be sent to.
+        :type xy: tuple
+        :rtype: luma.lcd.encoder.encoded_frame
+
+        .. versionadded:: 2.14.0
+        """
+        assert image.mode == self.mode
+        x, y = xy
+        bbox = (x, y, x + image.width, y + image.height)
+        assert 0 <= x and 0 <= y and bbox[2] <= self.width and bbox[3] <= self.height
+
+        if self.rotate != 0:
+            image = image.rotate(self.rotate * -90, expand=True)
+            bbox = _rotate_bbox(bbox, self.rotate, self.size)
+        else:
+            image = image.copy()
+
+        return luma.lcd.encoder.encoded_frame(
+            bbox, self.apply_offsets(bbox), self.encode_pixels(image), image)
+
+    def present(self, frame):
+        """
+        Sends a frame from :py:meth:`encode` to its region of the display, as
+        is. As with :py:meth:`blit`, the framebuffer's record of the previous
+        frame is patched.
+
+        :param frame: The encoded frame.
+        :type frame: luma.lcd.encoder.encoded_frame
+
+        .. versionadded:: 2.14.0
+        """
+        self._patch_framebuffer(frame.bbox, frame.image)
+        self.set_window(*frame.window)
+        self.data(frame.data)
+
+    def fill_rect(self, bbox, colour):
+        """
+        Fills a region of the display with a solid colour. The window is set
+        once, and then a short run of the encoded pixel, repeated, is streamed
+        to it, so no image need be built or encoded. As with :py:meth:`blit`,
+        the framebuffer's record of the previous frame is patched.
+
+        :param bbox: The ``(left, top, right, bottom)`` region to fill.
+        :type bbox: tuple
+        :param colour: The colour to fill with, in any form accepted by PIL,
+            such as ``"red"`` or ``(255, 0, 0)``.
+
+        .. versionadded:: 2.14.0
+        """
+        left, top, right, bottom = bbox
+        assert 0 <= left < right <= self.width and 0 <= top < bottom <= self.height
+
+        if self.rotate != 0:
+            bbox = _rotate_bbox(bbox, self.rotate, self.size)
+
+        pixel = Image.new(self.mode, (1, 1), colour)
+        self._patch_framebuffer(bbox, pixel.getpixel((0, 0)))
+
+        encoded = self.encode_pixels(pixel)
+        chunk = encoded * (self._FILL_CHUNK_SIZE // len(encoded))
+        remaining = (right - left) * (bottom - top) * len(encoded)
+
+        self.set_window(*self.apply_offsets(bbox))
+        while remaining > 0:
+            self.data(chunk if remaining >= len(chunk) else chunk[:remaining])
+            remaining -= len(chunk)
+
+    def clear(self):
+        """
+        Initializes the device memory with an empty (black) image.
+
+        .. versionchanged:: 2.14.0
+            Filled through :py:meth:`fill_rect`.
+        """
+        self.fill_rect((0, 0) + self.size, "black")
+
+
+def _rotate_bbox(bbox, rotate, size):
+    """
+    Maps a bounding box on an image of the given size into the image as
+    rotated by :py:meth:`luma.core.mixin.capabilities.preprocess`.
+    """
+    left, top, right, bottom = bbox
+    width, height = size
+    if rotate == 1:
+        return (height - bottom, left, height - top, right)
+    if rotate == 2:
+        return (width - right, height - bottom, width - left, height - top)
+    if rotate == 3:
+        return (top, width - right, bottom, width - left)
+    return bbox
+
+
+def _pixel_encoder(pixel_format):
+    """
+    Returns the function to encode RGB images into the given pixel format.
+    """
+    if pixel_format == "rgb666":
+        return lambda image: image.tobytes()
+    if pixel_format == "rgb565":
+        return luma.lcd.encoder.rgb565
+    raise luma.core.error.DeviceDisplayModeError(
+        f"Unsupported pixel format: {pixel_format}")
+
+
+class st7789(__window_mixin, backlit_device, __framebuffer_mixin, __madctl_mixin):
     """
     Serial interface to a colour ST7789 240x240 pixel LCD display.
 
+    :param framebuffer: Framebuffering strategy, currently instances of
+        ``diff_to_previous()`` or ``full_frame()`` are only supported. By
+        default, only the bounding box of whatever changed since the previous
+        frame is sent.
+    :type framebuffer: luma.core.framebuffer.framebuffer
+    :param pixel_format: Either ``"rgb666"`` (default), which sends 3 bytes
+        per pixel, or ``"rgb565"``, which sends 2 bytes per pixel, cutting the
+        bus traffic by a third at the cost of some colour depth.
+    :type pixel_format: str
+    :param hardware_rotate: Set to ``True`` to have the controller rotate its
+        address space, rather than rotating every frame in software. Where
+        this reverses the controller's 320 rows, the address window is offset
+        to where the panel then sits within them.
+    :type hardware_rotate: bool
+
+    A frame identical to the one last sent is not sent again; the number of
+    frames skipped this way is counted in :py:attr:`skipped_frames`.
+
     .. versionadded:: 2.9.0
+
+    .. versionchanged:: 2.14.0
+        Added the ``framebuffer``, ``pixel_format`` and ``hardware_rotate``
+        parameters.
     """
-    def __init__(self, serial_interface=None, width=240, height=240, rotate=0, **kwargs):
+    def __init__(self, serial_interface=None, width=240, height=240, rotate=0,
+                 framebuffer=None, pixel_format="rgb666", hardware_rotate=False, **kwargs):
         super(st7789, self).__init__(luma.lcd.const.st7789, serial_interface, **kwargs)
         self.capabilities(width, height, rotate, mode="RGB")
+        # A single segment, as the panels come in sizes (such as 240x135)
+        # which cannot be evenly subdivided
+        self.init_framebuffer(framebuffer, 1)
+        self.encode_pixels = _pixel_encoder(pixel_format)
+        self._window = None
+        self.skipped_frames = 0
+        self._last_frame = None
+
+        madctl = self.init_madctl(0x70, hardware_rotate)
+        self.apply_offsets = self._gram_offsets(madctl)
 
-        self.command(0x36, 0x70)     # MADCTL (36h): Memory Data Access Control: Bottom to Top, Right to Left, Reverse Mode
-        self.command(0x3A, 0x06)     # COLMOD (3Ah): Interface Pixel Format: 18bit/pixel
+        self.command(0x36, madctl)  # MADCTL (36h): Memory Data Access Control: Bottom to Top, Right to Left, Reverse Mode
+        if pixel_format == "rgb565":
+            self.command(0x3A, 0x55)  # COLMOD (3Ah): Interface Pixel Format: 16bit/pixel
+        else:
+            self.command(0x3A, 0x06)  # COLMOD (3Ah): Interface Pixel Format: 18bit/pixel
         self.command(0xB2,          # PORCTRL (B2h): Porch Setting: Disable separate porch control, 0xC in normal mode, 0x3 in idle and partial modes
                      0x0C, 0x0C, 0x00, 0x33, 0x33)
         self.command(0xB7, 0x35)      # GCTRL (B7h): Gate Control: VGH = 13.26V, VGL = -10.43V
@@ -337,18 +748,77 @@ class st7789(backlit_device):
         if args:
             self.data(args)
 
+    def _gram_offsets(self, madctl):
+        """
+        Returns the function to offset windows into display memory. The
+        controller's memory is 240x320, so when its 320 rows are addressed in
+        reverse (MY set, as for some hardware rotations), the panel's rows
+        start at an offset of 320 less the panel's own extent along them:
+        columns, if rows and columns are exchanged (MV set), else rows.
+        """
+        if not madctl & 0x80:
+            return lambda bbox: bbox
+
+        if madctl & 0x20:
+            dx, dy = 320 - self.width, 0
+        else:
+            dx, dy = 0, 320 - self.height
+
+        def offset(bbox):
+            left, top, right, bottom = bbox
+            return (left + dx, top + dy, right + dx, bottom + dy)
+        return offset
+
     def set_window(self, x1, y1, x2, y2):
-        self.command(0x2A,            # CASET (2Ah): Column Address Set
-                     x1 >> 8, x1 & 0xFF, (x2 - 1) >> 8, (x2 - 1) & 0xFF)
-        self.command(0x2B,            # RASET (2Bh): Row Address Set
-                     y1 >> 8, y1 & 0xFF, (y2 - 1) >> 8, (y2 - 1) & 0xFF)
+        """
+        Sets the address window for, and starts, a memory write. The column
+        and row addresses are only sent if the window differs from the last.
+        """
+        if (x1, y1, x2, y2) != self._window:
+            self.command(0x2A,        # CASET (2Ah): Column Address Set
+                         x1 >> 8, x1 & 0xFF, (x2 - 1) >> 8, (x2 - 1) & 0xFF)
+            self.command(0x2B,        # RASET (2Bh): Row Address Set
+                         y1 >> 8, y1 & 0xFF, (y2 - 1) >> 8, (y2 - 1) & 0xFF)
+            self._window = (x1, y1, x2, y2)
         self.command(0x2C)            # RAMWR (2Ch): Memory Write
 
     def display(self, image):
-        self.set_window(0, 0, self._w, self._h)
+        """
+        Renders a 24-bit RGB image to the ST7789 LCD display, addressing a
+        window for each of the regions the framebuffer reports as changed.
+
+        :param image: The image to render; images in other modes (such as
+            ``"1"``, ``"L"`` or ``"RGBA"``) are converted to RGB first.
+        :type image: PIL.Image.Image
+        """
+        assert image.size == self.size
+        if image.mode != self.mode:
+            image = image.convert(self.mode)
 
         image = self.preprocess(image)
-        self.data(list(image.convert("RGB").tobytes()))
+
+        # Other framebuffers already send nothing for an unchanged frame, so
+        # only a full frame is compared with the last one sent
+        if isinstance(self.framebuffer, luma.core.framebuffer.full_frame):
+            frame = image.tobytes()
+            if frame == self._last_frame:
+                self.skipped_frames += 1
+                return
+            self._last_frame = frame
+
+        sent = False
+        for image, bounding_box in self.framebuffer.redraw(image):
+            self.set_window(*self.apply_offsets(bounding_box))
+            self.data(self.encode_pixels(image))
+            sent = True
+
+        if not sent:
+            self.skipped_frames += 1
+
+    def _patch_framebuffer(self, bbox, source):
+        # The display no longer holds the last frame sent in full
+        self._last_frame = None
+        super(st7789, self)._patch_framebuffer(bbox, source)
 
     def contrast(self, level):
         """
@@ -360,7 +830,230 @@ class st7789(backlit_device):
         assert 0 <= level <= 255
 
 
-class st7567(backlit_device):
+class __page_mixin(object):
+    """
+    Helper class for the ST7567 and UC1701X displays, which share the same
+    page-addressed memory layout and addressing commands.
+    """
+
+    def init_pages(self, framebuffer):
+        # A 180° rotation is done by the controller, by reversing both the
+        # segment (column) and common (row) scan directions, after which the
+        # device is redeclared unrotated so frames are sent as drawn. The
+        # panel is wired to the first 128 of the 132 segment drivers (SEG0 to
+        # SEG127); with the segment direction reversed, column address 0
+        # drives SEG131, so columns are then offset by 4 to reach SEG127.
+        self._flipped = self.rotate == 2
+        if self._flipped:
+            self.capabilities(self.width, self.height, 0)
+            self._seg_direction = 0xA0
+            self._com_direction = 0xC8
+            self._column_offset = 0
+        else:
+            self._seg_direction = 0xA1
+            self._com_direction = 0xC0
+            self._column_offset = 4
+
+        self._pages = self._h // 8
+        self.skipped_frames = 0
+        self._last_buf = None
+        # The physical page that logical page 0 is displayed from, as moved
+        # by hardware scrolling
+        self._start_page = 0
+        self.framebuffer = framebuffer
+
+    def _set_address(self, page, column):
+        page = (page + self._start_page) % self._pages
+        column += self._column_offset
+        self.command(0xB0 | page, column & 0x0F, 0x10 | column >> 4)
+
+    def _write_pages(self, buf):
+        """
+        Sends the encoded page buffer to the display, restricted to the column
+        spans that changed if a framebuffer strategy is in use.
+        """
+        if buf == self._last_buf:
+            self.skipped_frames += 1
+            return
+        self._last_buf = buf
+
+        width = self._w
+
+        # Addressing a run of columns takes three command bytes: the page
+        # address and the column address high & low nibbles
+        spans = self.framebuffer.redraw(buf, width, 3, 3 * self._pages) if self.framebuffer else None
+        if spans is None:
+            spans = [(page, 0, width) for page in range(self._pages)]
+
+        view = memoryview(buf)
+        for page, start, end in spans:
+            offset = page * width
+            self._set_address(page, start)
+            self.data(view[offset + start:offset + end])
+
+    def encode(self, image):
+        """
+        Encodes an image, such as a splash screen that is shown repeatedly,
+        into the display's native page layout, once, ready for
+        :py:meth:`present`.
+
+        :param image: The full 1-bit image to encode.
+        :type image: PIL.Image.Image
+        :rtype: luma.lcd.encoder.encoded_frame
+
+        .. versionadded:: 2.14.0
+        """
+        assert image.mode == self.mode
+        assert image.size == self.size
+
+        # Rotation is folded into the packing, so there is no need to preprocess
+        bbox = (0, 0, self._w, self._h)
+        return luma.lcd.encoder.encoded_frame(
+            bbox, bbox, luma.lcd.encoder.pages(image, self.rotate), None)
+
+    def present(self, frame):
+        """
+        Sends a frame from :py:meth:`encode` to the display, as is (subject
+        to the framebuffer only sending the columns that changed).
+
+        :param frame: The encoded frame.
+        :type frame: luma.lcd.encoder.encoded_frame
+
+        .. versionadded:: 2.14.0
+        """
+        assert frame.bbox == (0, 0, self._w, self._h)
+        self._write_pages(frame.data)
+
+    def fill_pages(self, pattern):
+        """
+        Fills every page of the display memory with the same byte, without
+        building or encoding an image. Each byte holds a column of 8 pixels,
+        the least significant bit being the top-most, in the controller's own
+        (unrotated) layout.
+
+        :param pattern: The byte to fill with, ``0x00`` to clear every pixel
+            and ``0xFF`` to set every pixel.
+        :type pattern: int
+
+        .. versionadded:: 2.14.0
+        """
+        assert 0x00 <= pattern <= 0xFF
+        self._write_pages(bytes([pattern]) * (self._w * self._pages))
+
+    def clear(self):
+        """
+        Initializes the device memory with an empty (blank) image. Every page
+        is always written, even if the last frame sent was blank, so that
+        this can be used to resynchronise the display.
+
+        .. versionchanged:: 2.14.0
+            Filled through :py:meth:`fill_pages`.
+        """
+        self._last_buf = None
+        if self.framebuffer:
+            self.framebuffer.prev_buf = None
+        self.fill_pages(0x00)
+
+    def scroll(self, image, pages=1):
+        """
+        Scrolls the display contents vertically in hardware, by whole pages
+        (of 8 pixel rows), by moving the display start line. Only the newly
+        exposed pages are then sent, taken from the supplied image: the rest
+        of the image is assumed to match what was already on display, now
+        shifted by the scroll.
+
+        Later calls to :py:meth:`display` take the scrolled position into
+        account, so scrolling and drawing can be freely mixed.
+
+        :param image: The full 1-bit image, as it should appear after
+            scrolling.
+        :type image: PIL.Image.Image
+        :param pages: The number of pages to scroll up by, where the new
+            pages appear at the bottom of the display. Negative values scroll
+            down, with the new pages appearing at the top.
+        :type pages: int
+
+        .. note::
+            Scrolling is only supported with a ``rotate`` of 0 or 2.
+
+        .. versionadded:: 2.14.0
+        """
+        assert image.mode == self.mode
+        assert image.size == self.size
+        # A rotate of 2 is done in hardware, leaving the device unrotated
+        assert self.rotate == 0
+        assert -self._pages <= pages <= self._pages
+
+        width = self._w
+        buf = luma.lcd.encoder.pages(image)
+
+        self._start_page = (self._start_page + pages) % self._pages
+        self.command(0x40 | self._start_page * 8)
+
+        exposed = range(self._pages - pages, self._pages) if pages > 0 else range(-pages)
+        view = memoryview(buf)
+        for page in exposed:
+            offset = page * width
+            self._set_address(page, 0)
+            self.data(view[offset:offset + width])
+
+        # Keep the shadow copies in step with what is now held in display
+        # memory: the previous contents shifted, plus the exposed pages
+        def shifted(prev):
+            if prev is None:
+                return None
+            shift = pages * width % len(buf)
+            shadow = bytearray(prev[shift:] + prev[:shift])
+            for page in exposed:
+                offset = page * width
+                shadow[offset:offset + width] = buf[offset:offset + width]
+            return bytes(shadow)
+
+        self._last_buf = shifted(self._last_buf)
+        if self.framebuffer:
+            self.framebuffer.prev_buf = shifted(self.framebuffer.prev_buf)
+
+    def invert(self, enabled):
+        """
+        Switches the display between normal and inverse video in hardware,
+        without affecting the display memory.
+
+        :param enabled: Set to ``True`` for inverse video, ``False`` for normal.
+        :type enabled: bool
+
+        .. versionadded:: 2.14.0
+        """
+        self.command(self._const.INVERTDISPLAY if enabled else self._const.NORMALDISPLAY)
+
+    def all_on(self, enabled):
+        """
+        Lights up every pixel in hardware, without affecting the display
+        memory, so the current contents reappear once switched back.
+
+        :param enabled: Set to ``True`` to light every pixel, ``False`` to
+            resume showing the display memory.
+        :type enabled: bool
+
+        .. versionadded:: 2.14.0
+        """
+        self.command(self._const.DISPLAYALLON if enabled else self._const.DISPLAYALLON_RESUME)
+
+    def blank(self, enabled):
+        """
+        Blanks the display in hardware, without affecting the display memory,
+        so the current contents reappear once unblanked. On these controllers
+        this switches the display off, as with :py:meth:`hide`.
+
+        :param enabled: Set to ``True`` to blank the display, ``False`` to
+            show the display memory again.
+        :type enabled: bool
+
+        .. versionadded:: 2.14.0
+        """
+        self.command(self._const.DISPLAYOFF if enabled else self._const.DISPLAYON)
+
+
+class st7567(__page_mixin, backlit_device):
     """
     Serial interface to a monochrome ST7567 128x64 pixel LCD display.
 
@@ -373,21 +1066,33 @@ class st7567(backlit_device):
         data and commands through.
     :param rotate: An integer value of 0 (default), 1, 2 or 3 only, where 0 is
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
-        represents 270° rotation.
+        represents 270° rotation. A 180° rotation is done by the controller
+        itself, so :py:attr:`rotate` then reads 0.
     :type rotate: int
+    :param framebuffer: Framebuffering strategy: by default every page is
+        always sent, otherwise supply an instance of
+        :py:class:`luma.lcd.framebuffer.page_diff` to skip unchanged pages
+        and only send the columns that changed within the others.
+    :type framebuffer: luma.lcd.framebuffer.page_diff
+
+    A frame identical to the one last sent is not sent again; the number of
+    frames skipped this way is counted in :py:attr:`skipped_frames`.
 
     .. versionadded:: 1.1.0
+
+    .. versionchanged:: 2.14.0
+        A 180° rotation is done in hardware, after which :py:attr:`rotate`
+        reads 0 rather than 2.
     """
 
-    def __init__(self, serial_interface=None, rotate=0, **kwargs):
+    def __init__(self, serial_interface=None, rotate=0, framebuffer=None, **kwargs):
         super(st7567, self).__init__(luma.lcd.const.st7567, serial_interface, **kwargs)
         self.capabilities(128, 64, rotate)
-
-        self._pages = self._h // 8
+        self.init_pages(framebuffer)
 
         self.command(0xA3)  # Bias 1/7
-        self.command(0xA1)
-        self.command(0xC0)  # Normal Orientation
+        self.command(self._seg_direction)
+        self.command(self._com_direction)  # Normal (0xC0) or reverse (0xC8) orientation
         self.command(0xA6)  # Normal Display (0xA7 = inverse)
         self.command(0x40)
         self.command(0x2F)
@@ -404,34 +1109,7 @@ class st7567(backlit_device):
         Takes a 1-bit :py:mod:`PIL.Image` and dumps it to the ST7567
         LCD display
         """
-        assert image.mode == self.mode
-        assert image.size == self.size
-
-        image = self.preprocess(image)
-
-        set_page_address = 0xB0
-
-        image_data = image.getdata()
-        pixels_per_page = self.width * 8
-        buf = bytearray(self.width)
-
-        for y in range(0, int(self._pages * pixels_per_page), pixels_per_page):
-            self.command(set_page_address, 0x04, 0x10)
-            set_page_address += 1
-            offsets = [y + self.width * i for i in range(8)]
-
-            for x in range(self.width):
-                buf[x] = \
-                    (image_data[x + offsets[0]] and 0x01) | \
-                    (image_data[x + offsets[1]] and 0x02) | \
-                    (image_data[x + offsets[2]] and 0x04) | \
-                    (image_data[x + offsets[3]] and 0x08) | \
-                    (image_data[x + offsets[4]] and 0x10) | \
-                    (image_data[x + offsets[5]] and 0x20) | \
-                    (image_data[x + offsets[6]] and 0x40) | \
-                    (image_data[x + offsets[7]] and 0x80)
-
-            self.data(list(buf))
+        self.present(self.encode(image))
 
     def contrast(self, value):
         """
@@ -441,32 +1119,7 @@ class st7567(backlit_device):
         self.command(0x81, value)
 
 
-class __framebuffer_mixin(object):
-    """
-    Helper class for initializing the framebuffer. Its only purpose is to
-    log a deprecation warning if a string framebuffer is specified.
-
-    .. note::
-        Specifying the framebuffer as a string will be removed at the next
-        major release, and hence this mixin will become redundant and will
-        also be removed at that point.
-    """
-
-    def init_framebuffer(self, framebuffer, default_num_segments):
-        if framebuffer is None:
-            self.framebuffer = diff_to_previous(num_segments=default_num_segments)
-        elif isinstance(framebuffer, str):
-            import warnings
-            warnings.warn(
-                "Specifying framebuffer as a string is now deprecated; Supply an instance of class full_frame() or diff_to_previous() instead",
-                DeprecationWarning
-            )
-            self.framebuffer = getattr(luma.core.framebuffer, framebuffer)()
-        else:
-            self.framebuffer = framebuffer
-
-
-class st7735(backlit_device, __framebuffer_mixin):
+class st7735(__window_mixin, backlit_device, __framebuffer_mixin, __madctl_mixin):
     """
     Serial interface to a 262K color (6-6-6 RGB) ST7735 LCD display.
 
@@ -498,15 +1151,31 @@ class st7735(backlit_device, __framebuffer_mixin):
     :param v_offset: Vertical offset (in pixels) of screen to device memory
         (default: 0).
     :type v_offset: int
+    :param pixel_format: Either ``"rgb666"`` (default), which sends 3 bytes
+        per pixel, or ``"rgb565"``, which sends 2 bytes per pixel, cutting the
+        bus traffic by a third at the cost of some colour depth.
+    :type pixel_format: str
+    :param hardware_rotate: Set to ``True`` to have the controller rotate its
+        address space, rather than rotating every frame in software. The
+        ``h_offset`` and ``v_offset`` then apply to the rotated address space.
+    :type hardware_rotate: bool
 
     .. versionadded:: 0.3.0
+
+    .. versionchanged:: 2.14.0
+        Added the ``pixel_format`` and ``hardware_rotate`` parameters.
     """
 
     def __init__(self, serial_interface=None, width=160, height=128, rotate=0,
-                 framebuffer=None, h_offset=0, v_offset=0, bgr=False, inverse=False, **kwargs):
+                 framebuffer=None, h_offset=0, v_offset=0, bgr=False, inverse=False,
+                 pixel_format="rgb666", hardware_rotate=False, **kwargs):
         super(st7735, self).__init__(luma.lcd.const.st7735, serial_interface, **kwargs)
         self.capabilities(width, height, rotate, mode="RGB")
         self.init_framebuffer(framebuffer, 16)
+        self.encode_pixels = _pixel_encoder(pixel_format)
+        # Column & row address take 5 bytes each, memory write 1
+        self.planner = luma.lcd.planner.window_planner(11, 2 if pixel_format == "rgb565" else 3)
+        self._window = None
 
         if h_offset != 0 or v_offset != 0:
             def offset(bbox):
@@ -542,9 +1211,9 @@ class st7735(backlit_device, __framebuffer_mixin):
         self.command(0xC3, 0x8A, 0x2A)           # power control 4: BCLK/2, Opamp current small & Medium low
         self.command(0xC4, 0x8A, 0xEE)           # power control 5: partial mode/full-color
         self.command(0xC5, 0x0E)                 # VCOM Control 1
-        self.command(0x36, 0x60 | order)         # memory data access control
+        self.command(0x36, self.init_madctl(0x60 | order, hardware_rotate))  # memory data access control
         self.command(0x21 if inverse else 0x20)  # display inversion on(0x21)/off(0x20)
-        self.command(0x3A, 0x06)                 # interface pixel format
+        self.command(0x3A, 0x05 if pixel_format == "rgb565" else 0x06)  # interface pixel format: 16 or 18 bits
         self.command(0x13)                       # partial off (normal)
         self.command(0xE0,                       # gamma adjustment (+ polarity)
                      0x0F, 0x1A, 0x0F, 0x18, 0x2F, 0x28, 0x20, 0x22,
@@ -560,7 +1229,8 @@ class st7735(backlit_device, __framebuffer_mixin):
         """
         Renders a 24-bit RGB image to the ST7735 LCD display. The 8-bit RGB
         values are passed directly to the devices internal storage, but only
-        the 6 most-significant bits are used by the display.
+        the 6 most-significant bits are used by the display (or 5-6-5 bits,
+        packed before sending, with the ``rgb565`` pixel format).
 
         :param image: The image to render.
         :type image: PIL.Image.Image
@@ -570,14 +1240,20 @@ class st7735(backlit_device, __framebuffer_mixin):
 
         image = self.preprocess(image)
 
-        for image, bounding_box in self.framebuffer.redraw(image):
-            left, top, right, bottom = self.apply_offsets(bounding_box)
+        for image, bounding_box in self.planner.redraw(self.framebuffer, image):
+            self.set_window(*self.apply_offsets(bounding_box))
+            self.data(self.encode_pixels(image))
 
+    def set_window(self, left, top, right, bottom):
+        """
+        Sets the address window for, and starts, a memory write. The column
+        and row addresses are only sent if the window differs from the last.
+        """
+        if (left, top, right, bottom) != self._window:
             self.command(0x2A, left >> 8, left & 0xFF, (right - 1) >> 8, (right - 1) & 0xFF)     # Set column addr
             self.command(0x2B, top >> 8, top & 0xFF, (bottom - 1) >> 8, (bottom - 1) & 0xFF)     # Set row addr
-            self.command(0x2C)                                                                   # Memory write
-
-            self.data(list(image.tobytes()))
+            self._window = (left, top, right, bottom)
+        self.command(0x2C)                                                                   # Memory write
 
     def contrast(self, level):
         """
@@ -596,10 +1272,10 @@ class st7735(backlit_device, __framebuffer_mixin):
         """
         self._serial_interface.command(cmd)
         if len(args) > 0:
-            self._serial_interface.data(list(args))
+            self._serial_interface.data(args)
 
 
-class ili9341(backlit_device, __framebuffer_mixin):
+class ili9341(__window_mixin, backlit_device, __framebuffer_mixin, __madctl_mixin):
     """
     Serial interface to a 262k color (6-6-6 RGB) ILI9341 LCD display.
 
@@ -629,15 +1305,31 @@ class ili9341(backlit_device, __framebuffer_mixin):
     :param v_offset: Vertical offset (in pixels) of screen to device memory
         (default: 0).
     :type v_offset: int
+    :param pixel_format: Either ``"rgb666"`` (default), which sends 3 bytes
+        per pixel, or ``"rgb565"``, which sends 2 bytes per pixel, cutting the
+        bus traffic by a third at the cost of some colour depth.
+    :type pixel_format: str
+    :param hardware_rotate: Set to ``True`` to have the controller rotate its
+        address space, rather than rotating every frame in software. The
+        ``h_offset`` and ``v_offset`` then apply to the rotated address space.
+    :type hardware_rotate: bool
 
     .. versionadded:: 2.2.0
+
+    .. versionchanged:: 2.14.0
+        Added the ``pixel_format`` and ``hardware_rotate`` parameters.
     """
 
     def __init__(self, serial_interface=None, width=320, height=240, rotate=0,
-                 framebuffer=None, h_offset=0, v_offset=0, bgr=False, **kwargs):
+                 framebuffer=None, h_offset=0, v_offset=0, bgr=False,
+                 pixel_format="rgb666", hardware_rotate=False, **kwargs):
         super(ili9341, self).__init__(luma.lcd.const.ili9341, serial_interface, **kwargs)
         self.capabilities(width, height, rotate, mode="RGB")
         self.init_framebuffer(framebuffer, 25)
+        self.encode_pixels = _pixel_encoder(pixel_format)
+        # Column & row address take 5 bytes each, memory write 1
+        self.planner = luma.lcd.planner.window_planner(11, 2 if pixel_format == "rgb565" else 3)
+        self._window = None
 
         if h_offset != 0 or v_offset != 0:
             def offset(bbox):
@@ -674,8 +1366,11 @@ class ili9341(backlit_device, __framebuffer_mixin):
         self.command(0xc1, 0x10)                          # Power Control 2, SAP[2:0], BT[3:0]
         self.command(0xc5, 0x3e, 0x28)                    # VCM Control 1
         self.command(0xc7, 0x86)                          # VCM Control 2
-        self.command(0x36, 0x20 | order)                  # Memory Access Control
-        self.command(0x3a, 0x46)                          # Pixel Format 6-6-6
+        self.command(0x36, self.init_madctl(0x20 | order, hardware_rotate))  # Memory Access Control
+        if pixel_format == "rgb565":
+            self.command(0x3a, 0x55)                      # Pixel Format 5-6-5
+        else:
+            self.command(0x3a, 0x46)                      # Pixel Format 6-6-6
         self.command(0xb1, 0x00, 0x18)                    # FRMCTR1
         self.command(0xb6, 0x08, 0x82, 0x27)              # Display Function Control
         self.command(0xf2, 0x00)                          # 3Gamma Function Disable
@@ -695,7 +1390,8 @@ class ili9341(backlit_device, __framebuffer_mixin):
         """
         Renders a 24-bit RGB image to the ILI9341 LCD display. The 8-bit RGB
         values are passed directly to the devices internal storage, but only
-        the 6 most-significant bits are used by the display.
+        the 6 most-significant bits are used by the display (or 5-6-5 bits,
+        packed before sending, with the ``rgb565`` pixel format).
 
         :param image: The image to render.
         :type image: PIL.Image.Image
@@ -705,14 +1401,20 @@ class ili9341(backlit_device, __framebuffer_mixin):
 
         image = self.preprocess(image)
 
-        for image, bounding_box in self.framebuffer.redraw(image):
-            left, top, right, bottom = self.apply_offsets(bounding_box)
+        for image, bounding_box in self.planner.redraw(self.framebuffer, image):
+            self.set_window(*self.apply_offsets(bounding_box))
+            self.data(self.encode_pixels(image))
 
+    def set_window(self, left, top, right, bottom):
+        """
+        Sets the address window for, and starts, a memory write. The column
+        and row addresses are only sent if the window differs from the last.
+        """
+        if (left, top, right, bottom) != self._window:
             self.command(0x2a, left >> 8, left & 0xff, (right - 1) >> 8, (right - 1) & 0xff)     # Set column addr
             self.command(0x2b, top >> 8, top & 0xff, (bottom - 1) >> 8, (bottom - 1) & 0xff)     # Set row addr
-            self.command(0x2c)                                                                   # Memory write
-
-            self.data(image.tobytes())
+            self._window = (left, top, right, bottom)
+        self.command(0x2c)                                                                   # Memory write
 
     def contrast(self, level):
         """
@@ -731,10 +1433,10 @@ class ili9341(backlit_device, __framebuffer_mixin):
         """
         self._serial_interface.command(cmd)
         if len(args) > 0:
-            self._serial_interface.data(list(args))
+            self._serial_interface.data(args)
 
 
-class ili9486(backlit_device, __framebuffer_mixin):
+class ili9486(__window_mixin, backlit_device, __framebuffer_mixin):
     """
     Serial interface to a 262k color (6-6-6 RGB) ILI9486 LCD display.
 
@@ -759,7 +1461,8 @@ class ili9486(backlit_device, __framebuffer_mixin):
         represents 270° rotation.
     :type rotate: int
     :param framebuffer: Framebuffering strategy, currently instances of
-        ``diff_to_previous()`` or ``full_frame()`` are only supported.
+        ``diff_to_previous()``, ``full_frame()`` or
+        :py:class:`luma.lcd.framebuffer.tile_diff` are only supported.
     :type framebuffer: luma.core.framebuffer.framebuffer
     :param bgr: Set to ``True`` if device pixels are BGR order (rather than RGB).
     :type bgr: bool
@@ -781,6 +1484,10 @@ class ili9486(backlit_device, __framebuffer_mixin):
         super(ili9486, self).__init__(luma.lcd.const.ili9486, serial_interface, **kwargs)
         self.capabilities(width, height, rotate, mode="RGB")
         self.init_framebuffer(framebuffer, 25)
+        self.encode_pixels = _pixel_encoder("rgb666")
+        # Padded column & row address take 9 bytes each, memory write 1
+        self.planner = luma.lcd.planner.window_planner(19, 3)
+        self._window = None
 
         if h_offset != 0 or v_offset != 0:
             def offset(bbox):
@@ -867,17 +1574,23 @@ class ili9486(backlit_device, __framebuffer_mixin):
 
         image = self.preprocess(image)
 
-        for image, bounding_box in self.framebuffer.redraw(image):
-            # Transposing the display shifts the dimension measurements
-            top, left, bottom, right = self.apply_offsets(bounding_box)
-
-            # Per earlier comments, Waveshare's display needs padding
-            # for commands.
-            self.command(0x2a, 0, top >> 8, 0, top & 0xff, 0, (bottom - 1) >> 8, 0, (bottom - 1) & 0xff)     # Set row addr
-            self.command(0x2b, 0, left >> 8, 0, left & 0xff, 0, (right - 1) >> 8, 0, (right - 1) & 0xff)     # Set column addr
-            self.command(0x2c)                                                                   # Memory write
+        for image, bounding_box in self.planner.redraw(self.framebuffer, image):
+            self.set_window(*self.apply_offsets(bounding_box))
+            self.data(self.encode_pixels(image))
 
-            self.data(image.tobytes())
+    def set_window(self, left, top, right, bottom):
+        """
+        Sets the address window for, and starts, a memory write. The column
+        and row addresses are only sent if the window differs from the last.
+        """
+        if (left, top, right, bottom) != self._window:
+            # Transposing the display shifts the dimension measurements, and
+            # per earlier comments, Waveshare's display needs padding for
+            # commands.
+            self.command(0x2a, 0, left >> 8, 0, left & 0xff, 0, (right - 1) >> 8, 0, (right - 1) & 0xff)     # Set row addr
+            self.command(0x2b, 0, top >> 8, 0, top & 0xff, 0, (bottom - 1) >> 8, 0, (bottom - 1) & 0xff)     # Set column addr
+            self._window = (left, top, right, bottom)
+        self.command(0x2c)                                                                   # Memory write
 
     def contrast(self, level):
         """
@@ -896,10 +1609,10 @@ class ili9486(backlit_device, __framebuffer_mixin):
         """
         self._serial_interface.command(cmd)
         if len(args) > 0:
-            self._serial_interface.data(list(args))
+            self._serial_interface.data(args)
 
 
-class ili9488(backlit_device, __framebuffer_mixin):
+class ili9488(__window_mixin, backlit_device, __framebuffer_mixin, __madctl_mixin):
     """
     Serial interface to a 262k color (6-6-6 RGB) ILI9488 LCD display.
 
@@ -919,7 +1632,8 @@ class ili9488(backlit_device, __framebuffer_mixin):
         represents 270° rotation.
     :type rotate: int
     :param framebuffer: Framebuffering strategy, currently instances of
-        ``diff_to_previous()`` or ``full_frame()`` are only supported.
+        ``diff_to_previous()``, ``full_frame()`` or
+        :py:class:`luma.lcd.framebuffer.tile_diff` are only supported.
     :type framebuffer: luma.core.framebuffer.framebuffer
     :param bgr: Set to ``True`` if device pixels are BGR order (rather than RGB).
     :type bgr: bool
@@ -929,15 +1643,26 @@ class ili9488(backlit_device, __framebuffer_mixin):
     :param v_offset: Vertical offset (in pixels) of screen to device memory
         (default: 0).
     :type v_offset: int
+    :param hardware_rotate: Set to ``True`` to have the controller rotate its
+        address space, rather than rotating every frame in software. The
+        ``h_offset`` and ``v_offset`` then apply to the rotated address space.
+    :type hardware_rotate: bool
 
     .. versionadded:: 2.11.0
+
+    .. versionchanged:: 2.14.0
+        Added the ``hardware_rotate`` parameter.
     """
 
     def __init__(self, serial_interface=None, width=480, height=320, rotate=0,
-                 framebuffer=None, h_offset=0, v_offset=0, bgr=False, **kwargs):
+                 framebuffer=None, h_offset=0, v_offset=0, bgr=False, hardware_rotate=False, **kwargs):
         super(ili9488, self).__init__(luma.lcd.const.ili9488, serial_interface, **kwargs)
         self.capabilities(width, height, rotate, mode="RGB")
         self.init_framebuffer(framebuffer, 25)
+        self.encode_pixels = _pixel_encoder("rgb666")
+        # Column & row address take 5 bytes each, memory write 1
+        self.planner = luma.lcd.planner.window_planner(11, 3)
+        self._window = None
 
         if h_offset != 0 or v_offset != 0:
             def offset(bbox):
@@ -968,7 +1693,7 @@ class ili9488(backlit_device, __framebuffer_mixin):
         self.command(0xc0, 0x17, 0x15)                                 # Power Control 1
         self.command(0xc1, 0x41)                                       # Power Control 2
         self.command(0xc5, 0x00, 0x12, 0x80)                           # VCOM Control
-        self.command(0x36, 0x20 | order)                               # Memory Access Control
+        self.command(0x36, self.init_madctl(0x20 | order, hardware_rotate))  # Memory Access Control
         self.command(0x3a, 0x66)                                       # Interface Pixel Format 6-6-6
         self.command(0xb0, 0x00)                                       # Interface Mode Control
         self.command(0xb1, 0xa0)                                       # Frame Rate Control
@@ -995,14 +1720,20 @@ class ili9488(backlit_device, __framebuffer_mixin):
 
         image = self.preprocess(image)
 
-        for image, bounding_box in self.framebuffer.redraw(image):
-            left, top, right, bottom = self.apply_offsets(bounding_box)
+        for image, bounding_box in self.planner.redraw(self.framebuffer, image):
+            self.set_window(*self.apply_offsets(bounding_box))
+            self.data(self.encode_pixels(image))
 
+    def set_window(self, left, top, right, bottom):
+        """
+        Sets the address window for, and starts, a memory write. The column
+        and row addresses are only sent if the window differs from the last.
+        """
+        if (left, top, right, bottom) != self._window:
             self.command(0x2a, left >> 8, left & 0xff, (right - 1) >> 8, (right - 1) & 0xff)     # Set column addr
             self.command(0x2b, top >> 8, top & 0xff, (bottom - 1) >> 8, (bottom - 1) & 0xff)     # Set row addr
-            self.command(0x2c)                                                                   # Memory write
-
-            self.data(image.tobytes())
+            self._window = (left, top, right, bottom)
+        self.command(0x2c)                                                                   # Memory write
 
     def contrast(self, level):
         """
@@ -1021,7 +1752,7 @@ class ili9488(backlit_device, __framebuffer_mixin):
         """
         self._serial_interface.command(cmd)
         if len(args) > 0:
-            self._serial_interface.data(list(args))
+            self._serial_interface.data(args)
 
 
 @rpi_gpio
@@ -1048,6 +1779,9 @@ class ht1621(backlit_device):
     :param CS: The chip select pin to connect to, default BCM 8.
     :type CS: int
 
+    A frame identical to the one last sent is not sent again; the number of
+    frames skipped this way is counted in :py:attr:`skipped_frames`.
+
     .. versionadded:: 0.4.0
     """
 
@@ -1057,6 +1791,9 @@ class ht1621(backlit_device):
         super(ht1621, self).__init__(luma.lcd.const.ht1621, noop(), gpio=gpio, **kwargs)
         self.capabilities(width, 8, rotate)
         self.segment_mapper = dot_muncher
+        self._buf = bytearray(self._w)
+        self._last_buf = None
+        self.skipped_frames = 0
         self._gpio = gpio or self.__rpi_gpio__()
 
         self._WR = self._configure(WR)
@@ -1085,7 +1822,7 @@ class ht1621(backlit_device):
 
         image = self.preprocess(image)
 
-        buf = []
+        buf = self._buf
 
         for x in range(self._w):
             byte = 0
@@ -1093,7 +1830,12 @@ class ht1621(backlit_device):
                 if image.getpixel((x, y)) > 0:
                     byte |= 1 << y
 
-            buf.append(byte)
+            buf[x] = byte
+
+        if buf == self._last_buf:
+            self.skipped_frames += 1
+            return
+        self._last_buf = bytes(buf)
 
         self.data(buf)
 
@@ -1132,7 +1874,7 @@ class ht1621(backlit_device):
         self._gpio.cleanup()
 
 
-class uc1701x(backlit_device):
+class uc1701x(__page_mixin, backlit_device):
     """
     Serial interface to a monochrome UC1701X LCD display.
 
@@ -1145,17 +1887,29 @@ class uc1701x(backlit_device):
         data and commands through.
     :param rotate: An integer value of 0 (default), 1, 2 or 3 only, where 0 is
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
-        represents 270° rotation.
+        represents 270° rotation. A 180° rotation is done by the controller
+        itself, so :py:attr:`rotate` then reads 0.
     :type rotate: int
+    :param framebuffer: Framebuffering strategy: by default every page is
+        always sent, otherwise supply an instance of
+        :py:class:`luma.lcd.framebuffer.page_diff` to skip unchanged pages
+        and only send the columns that changed within the others.
+    :type framebuffer: luma.lcd.framebuffer.page_diff
+
+    A frame identical to the one last sent is not sent again; the number of
+    frames skipped this way is counted in :py:attr:`skipped_frames`.
 
     .. versionadded:: 0.5.0
+
+    .. versionchanged:: 2.14.0
+        A 180° rotation is done in hardware, after which :py:attr:`rotate`
+        reads 0 rather than 2.
     """
 
-    def __init__(self, serial_interface=None, rotate=0, **kwargs):
+    def __init__(self, serial_interface=None, rotate=0, framebuffer=None, **kwargs):
         super(uc1701x, self).__init__(luma.lcd.const.uc1701x, serial_interface, **kwargs)
         self.capabilities(128, 64, rotate)
-
-        self._pages = self._h // 8
+        self.init_pages(framebuffer)
 
         self.command(0xE2)          # System reset
         self.command(0x2C)          # Power: Boost ON
@@ -1164,8 +1918,8 @@ class uc1701x(backlit_device):
         self.command(0xF8, 0x00)    # Booster ratio to 4x
         self.command(0x23)          # Set resistor ratio = 3
         self.command(0xA2)          # Bias 1/9
-        self.command(0xC0)          # Set COM direction
-        self.command(0xA1)          # Set SEG direction
+        self.command(self._com_direction)  # Set COM direction
+        self.command(self._seg_direction)  # Set SEG direction
         self.command(0xAC)          # Static indicator
         self.command(0xA6)          # Disable inverse
         self.command(0xA5)          # Display all points
@@ -1181,33 +1935,7 @@ class uc1701x(backlit_device):
         Takes a 1-bit :py:mod:`PIL.Image` and dumps it to the UC1701X
         LCD display.
         """
-        assert image.mode == self.mode
-        assert image.size == self.size
-
-        image = self.preprocess(image)
-
-        set_page_address = 0xB0
-        image_data = image.getdata()
-        pixels_per_page = self.width * 8
-        buf = bytearray(self.width)
-
-        for y in range(0, int(self._pages * pixels_per_page), pixels_per_page):
-            self.command(set_page_address, 0x04, 0x10)
-            set_page_address += 1
-            offsets = [y + self.width * i for i in range(8)]
-
-            for x in range(self.width):
-                buf[x] = \
-                    (image_data[x + offsets[0]] and 0x01) | \
-                    (image_data[x + offsets[1]] and 0x02) | \
-                    (image_data[x + offsets[2]] and 0x04) | \
-                    (image_data[x + offsets[3]] and 0x08) | \
-                    (image_data[x + offsets[4]] and 0x10) | \
-                    (image_data[x + offsets[5]] and 0x20) | \
-                    (image_data[x + offsets[6]] and 0x40) | \
-                    (image_data[x + offsets[7]] and 0x80)
-
-            self.data(list(buf))
+        self.present(self.encode(image))
 
     def contrast(self, value):
         """
@@ -1217,6 +1945,29 @@ class uc1701x(backlit_device):
         self.command(0x81, value >> 2)
 
 
+def _bitbang_bus(interface):
+    """
+    Returns the GPIO module and the RS, E and data pins of a
+    :py:class:`luma.core.interface.parallel.bitbang_6800` interface, for
+    reading back from the bus. These are not part of the interface's public
+    API, so are checked for here, once, rather than failing part way through
+    a read.
+    """
+    if not isinstance(interface, bitbang_6800):
+        raise luma.core.error.UnsupportedPlatform(
+            'Reading the busy flag requires a bitbang_6800 interface')
+
+    missing = [attr for attr in ('_gpio', '_RS', '_E', '_PINS') if not hasattr(interface, attr)]
+    gpio = getattr(interface, '_gpio', None)
+    missing += [attr for attr in ('setup', 'input', 'IN', 'OUT') if not hasattr(gpio, attr)]
+    if missing:
+        raise luma.core.error.UnsupportedPlatform(
+            'Reading the busy flag is not supported by this version of luma.core '
+            f'(bitbang_6800 has no {", ".join(missing)})')
+
+    return gpio, interface._RS, interface._E, list(interface._PINS)
+
+
 class hd44780(backlit_device, parallel_device, character, __framebuffer_mixin):
     """
     Driver for a HD44780 style LCD display.  This class provides a ``text``
@@ -1258,11 +2009,25 @@ class hd44780(backlit_device, parallel_device, character, __framebuffer_mixin):
         configured on the interface.
     :type backpack_pin: int
     :param framebuffer: Framebuffering strategy, currently instances of
-        ``diff_to_previous()`` or ``full_frame()`` are only supported.
+        ``diff_to_previous()`` or ``full_frame()`` are only supported. Unless
+        ``full_frame()`` is used, only the cells whose character codes differ
+        from a shadow copy of the display memory are sent.
     :type framebuffer: luma.core.framebuffer.framebuffer
     :param backlight: The serial interface (usually a
         :py:class:`luma.core.interface.serial.parallel` instance) to delegate
         sending backlight control commands through.
+    :param gpio_RW: The GPIO pin the read/write (R/W) line is connected to,
+        if it is not tied low. When provided (with a
+        :py:class:`luma.core.interface.parallel.bitbang_6800` interface),
+        rather than waiting for the worst case ``exec_time`` after each
+        command, the busy flag is polled until the controller is ready.
+        Note that while R/W is high, a 5V HD44780 drives the data lines at
+        5V, so on a 3.3V Raspberry Pi the data lines need level shifting
+        (or the display must run at 3.3V) before R/W is connected.
+    :type gpio_RW: int
+    :param busy_timeout: The longest time in seconds to poll the busy flag
+        for, after which the controller is assumed to be ready.
+    :type busy_timeout: float
 
     To place text on the display, simply assign the text to the ``text``
     instance variable::
@@ -1278,10 +2043,16 @@ class hd44780(backlit_device, parallel_device, character, __framebuffer_mixin):
         This driver currently only supports the hd44780 5x8 display mode.
 
     .. versionadded:: 2.5.0
+
+    .. versionchanged:: 2.14.0
+        Only the cells that changed are sent, commands are waited on only
+        before the next write, and added the ``gpio_RW`` and
+        ``busy_timeout`` parameters.
     """
 
     def __init__(self, serial_interface=None, width=16, height=2, undefined='_',
-                 selected_font=0, exec_time=0.000001, framebuffer=None, backlight=None, **kwargs):
+                 selected_font=0, exec_time=0.000001, framebuffer=None, backlight=None,
+                 gpio_RW=None, busy_timeout=0.01, **kwargs):
         super(hd44780, self).__init__(luma.lcd.const.hd44780, serial_interface, backlight=backlight,
         exec_time=exec_time, **kwargs)
 
@@ -1289,6 +2060,21 @@ class hd44780(backlit_device, parallel_device, character, __framebuffer_mixin):
         # backlit_device requires it to be initialized here
         self._exec_time = exec_time
 
+        # When the controller will next be ready, or, when polling, whether
+        # the busy flag must be checked before the next write
+        self._ready_at = 0
+        self._busy = False
+
+        # The busy flag can only be read once initialization is complete
+        self._poll_busy = False
+        self._RW = gpio_RW
+        self._busy_timeout = busy_timeout
+        if gpio_RW is not None:
+            self._bus = _bitbang_bus(self._serial_interface)
+            gpio = self._bus[0]
+            gpio.setup(gpio_RW, gpio.OUT)
+            gpio.output(gpio_RW, gpio.LOW)
+
         self.capabilities(width * 5, height * 8, 0)
         self.init_framebuffer(framebuffer, 1)
 
@@ -1298,7 +2084,21 @@ class hd44780(backlit_device, parallel_device, character, __framebuffer_mixin):
         self.glyph_index = self.font.current.glyph_index
         self.device = self
         self._undefined = undefined
+        # The glyphs loaded into each custom character (CGRAM) slot, indexed
+        # both ways, with the number of cells in display memory using each
+        # slot and when each was last used
         self._custom = {}
+        self._cgram = [None] * self._const.CUSTOMCHARS
+        self._cgram_refs = [0] * self._const.CUSTOMCHARS
+        self._cgram_used = [0] * self._const.CUSTOMCHARS
+        self._updates = 0
+        # Character code (or custom glyph) lookups, for the font they were
+        # made from
+        self._cells_font = None
+        self._cells = {}
+        # Shadow copy of the character codes held in display memory, None
+        # where not known
+        self._ddram = [[None] * width for _ in range(height)]
 
         # Supported modes
         supported = (width, height) in [
@@ -1312,8 +2112,12 @@ class hd44780(backlit_device, parallel_device, character, __framebuffer_mixin):
                 f"Unsupported display mode: {width} x {height}")
 
         self._initialize_device()
+        self._poll_busy = gpio_RW is not None
         self.text = ''
         self.command(self._const.CLEAR, exec_time=1e-3 * 1.5)
+        # Clearing fills the display memory with spaces
+        self._ddram = [[0x20] * width for _ in range(height)]
+        self._cgram_refs = [0] * self._const.CUSTOMCHARS
 
     def _initialize_device(self):
         """
@@ -1381,6 +2185,85 @@ class hd44780(backlit_device, parallel_device, character, __framebuffer_mixin):
         self.command(self._const.ENTRY)  # Set entry mode to right, no shift
         self.command(self._const.DISPLAYON, exec_time=1e-3 * 100)  # Turn display on
 
+    def command(self, *cmd, exec_time=None, only_low_bits=False):
+        """
+        Sends a command or sequence of commands through to the serial
+        interface. Rather than waiting for it to complete straight away, the
+        wait is deferred until just before the next write, so that any work
+        done in between overlaps the time the controller takes: either the
+        given ``exec_time`` (or the device default), or, if the R/W line is
+        connected, until the busy flag clears.
+
+        :param cmd: A spread of commands.
+        :type cmd: int
+        :param exec_time: Amount of time to wait for the command to finish
+            execution.  If not provided, the device default will be used instead
+        :type exec_time: float
+        :param only_low_bits: If ``True``, only the lowest four bits of the command
+            will be sent.  This is necessary on some devices during initialization
+        :type only_low_bits: bool
+        """
+        self._wait_ready()
+        cmd = cmd if (self._bitmode == 8 or only_low_bits) else \
+            bytes_to_nibbles(cmd)
+        self._serial_interface.command(*cmd)
+        if self._poll_busy:
+            self._busy = True
+        else:
+            self._ready_at = monotonic() + (exec_time or self._exec_time)
+
+    def data(self, data):
+        """
+        Sends a sequence of bytes through to the serial interface, once the
+        controller has finished executing any previous command.
+
+        :param data: a sequence of bytes to send to the display
+        :type data: list
+        """
+        self._wait_ready()
+        super(hd44780, self).data(data)
+
+    def _wait_ready(self):
+        """
+        Waits out whatever remains of the previous command's execution time.
+        """
+        if self._busy:
+            self._busy = False
+            self._poll_busy_flag()
+        else:
+            remaining = self._ready_at - monotonic()
+            if remaining > 0:
+                sleep(remaining)
+
+    def _poll_busy_flag(self):
+        """
+        Polls the busy flag (DB7) until the controller is ready for the next
+        instruction, or the busy timeout has passed.
+        """
+        gpio, RS, E, pins = self._bus
+
+        # Release the data bus before the controller drives it
+        for pin in pins:
+            gpio.setup(pin, gpio.IN)
+        gpio.output(RS, gpio.LOW)
+        gpio.output(self._RW, gpio.HIGH)
+
+        deadline = monotonic() + self._busy_timeout
+        while True:
+            gpio.output(E, gpio.HIGH)
+            busy = gpio.input(pins[-1])
+            gpio.output(E, gpio.LOW)
+            if self._bitmode == 4:
+                # The low nibble of the address counter must also be clocked out
+                gpio.output(E, gpio.HIGH)
+                gpio.output(E, gpio.LOW)
+            if not busy or monotonic() >= deadline:
+                break
+
+        gpio.output(self._RW, gpio.LOW)
+        for pin in pins:
+            gpio.setup(pin, gpio.OUT)
+
     def display(self, image):
         """
         Takes a 1-bit :py:mod:`PIL.Image` and converts it to text data
@@ -1397,28 +2280,121 @@ class hd44780(backlit_device, parallel_device, character, __framebuffer_mixin):
             Most hd44780s have limited memory to support custom characters
             and typically can only support 8 at any one time.  If this is
             exceeded, the remaining unmatched characters will be replaced by
-            the ``undefined`` character.
+            the ``undefined`` character. Custom characters stay loaded once
+            no longer displayed, to be reused if needed again, until the
+            slot is needed for another (least recently used first).
         """
         assert image.mode == self.mode
         assert image.size == self.size
 
-        self._cleanup_custom(image)
-
+        cells = []
         for image_segment, bounding_box in self.framebuffer.redraw(image):
             changed_segments = self._get_segments(image, bounding_box)
 
             for y, x, line in changed_segments:
-                buf = []
                 for segment in line:
-                    bytes = segment.tobytes()
-                    c = self.glyph_index[bytes] if bytes in self.glyph_index else \
-                        self._custom[bytes] if bytes in self._custom else None
-                    if c is None:
-                        self._make_custom(segment)
-                        c = self._custom.get(bytes, ord(self._undefined))
-                    buf.append(c)
-                self.command(self._const.DDRAMADDR | (self._const.LINES[y] + x))
-                self.data(buf)
+                    cells.append((y, x, self.glyph_index.get(segment.tobytes(), segment)))
+                    x += 1
+
+        self._write_cells(cells)
+
+    def _flush(self, buf):
+        """
+        Writes text straight to the display as character codes, looked up
+        character by character from the font's tables, rather than rendering
+        it to an image and matching each cell back to a glyph. Only cells
+        which need custom characters are created from glyph images.
+
+        Falls back to rendering the text if the font has any glyphs placed
+        outside of a 5x8 cell.
+        """
+        rows = self._text_cells(str(buf))
+        if rows is None:
+            super(hd44780, self)._flush(buf)
+            return
+
+        self._write_cells((y, x, cell) for y, row in enumerate(rows) for x, cell in enumerate(row))
+
+        # The framebuffer no longer holds what is on display, so the next
+        # image displayed is sent in full
+        if hasattr(self.framebuffer, "prev_image"):
+            self.framebuffer.prev_image = None
+
+    def _text_cells(self, text):
+        """
+        Lays out the text a cell at a time, as it would be rendered, giving
+        the character code, or the glyph image where a custom character is
+        needed, for each cell. Returns ``None`` if the text cannot be laid out
+        in cells.
+        """
+        font = self.font.current
+        if font is not self._cells_font:
+            self._cells_font = font
+            self._cells = {}
+        cells = self._cells
+
+        width = self._w // 5
+        lines = text.split("\n")
+        rows = []
+        for y in range(self._h // 8):
+            line = lines[y][:width] if y < len(lines) else ""
+            row = []
+            for char in line.ljust(width):
+                if char not in cells:
+                    cells[char] = self._lookup_cell(font, char)
+                cell = cells[char]
+                if cell is None:
+                    return None
+                row.append(cell)
+            rows.append(row)
+        return rows
+
+    def _lookup_cell(self, font, char):
+        """
+        Looks up the character code for a single character, or its glyph image
+        if it is not one of the font's own; characters not in the font are
+        replaced by the ``undefined`` character, and then by a blank.
+        """
+        for c in (char, self._undefined):
+            index = font.mappings.get(ord(c), font.mappings.get(ord(c) + font.PUA_SPACE))
+            if index is not None:
+                break
+        else:
+            return font.glyph_index[bytes(8)]
+
+        metric = font.metrics[index]
+        if metric['xwidth'] != 5 or tuple(metric['dst']) != (0, -8, 5, 0) or font.baseline != 8:
+            return None
+        glyph = metric['img']
+        return font.glyph_index.get(glyph.tobytes(), glyph)
+
+    def _write_cells(self, cells):
+        """
+        Writes the character code for each ``(line, column, code)`` cell,
+        where the code may instead be a glyph image needing a custom
+        character, skipping those that the shadow copy of the display memory
+        shows are already displayed (unless the full frame is always to be
+        sent). The writes are ordered by address, so that a run of consecutive
+        addresses needs only one address command, the controller incrementing
+        the address after each write.
+        """
+        full = isinstance(self.framebuffer, luma.core.framebuffer.full_frame)
+        ddram = self._ddram
+        lines = self._const.LINES
+
+        dirty = {}
+        for (y, x), code in self._assign_custom(cells).items():
+            if full or ddram[y][x] != code:
+                ddram[y][x] = code
+                dirty[lines[y] + x] = code
+        dirty = sorted(dirty.items())
+
+        start = 0
+        for i in range(1, len(dirty) + 1):
+            if i == len(dirty) or dirty[i][0] != dirty[i - 1][0] + 1:
+                self.command(self._const.DDRAMADDR | dirty[start][0])
+                self.data([code for _, code in dirty[start:i]])
+                start = i
 
     def _get_segments(self, image, bounding_box):
         # Expand bounding box to align to cell boundaries (5,8)
@@ -1439,23 +2415,67 @@ class hd44780(backlit_device, parallel_device, character, __framebuffer_mixin):
 
         return lines
 
-    def _make_custom(self, img):
+    def _assign_custom(self, cells):
         """
-        Create a new custom character based upon the provided image
+        Resolves the glyph images among the ``(line, column, code)`` cells to
+        custom character codes, returning the code for each cell position.
+
+        Glyphs already loaded are reused as they are. Others are loaded into a
+        free slot: one that no cell uses once this update is made, preferring
+        a slot never loaded and otherwise the least recently used. The slot
+        reference counts are kept in step with the cells as they are
+        updated, so there is no need to scan the whole display for the
+        glyphs in use. If no slot is free, the ``undefined`` character is
+        used instead.
+        """
+        num_slots = self._const.CUSTOMCHARS
+        refs = self._cgram_refs
+        self._updates += 1
+
+        codes = {}
+        pending = {}
+        for y, x, cell in cells:
+            if (y, x) in codes:
+                continue
+            old = self._ddram[y][x]
+            if old is not None and old < num_slots:
+                refs[old] -= 1
+            if not isinstance(cell, int):
+                data = cell.tobytes()
+                if data not in self._custom:
+                    pending.setdefault(data, (cell, []))[1].append((y, x))
+                    codes[(y, x)] = None
+                    continue
+                cell = self._custom[data]
+                self._cgram_used[cell] = self._updates
+            if cell < num_slots:
+                refs[cell] += 1
+            codes[(y, x)] = cell
+
+        for data, (glyph, positions) in pending.items():
+            free = [slot for slot in range(num_slots) if refs[slot] == 0]
+            if free:
+                slot = min(free, key=lambda slot: (self._cgram[slot] is not None, self._cgram_used[slot]))
+                self._make_custom(slot, glyph)
+                refs[slot] += len(positions)
+                code = slot
+            else:
+                code = ord(self._undefined)
+            for position in positions:
+                codes[position] = code
+
+        return codes
+
+    def _make_custom(self, idx, img):
+        """
+        Loads the provided image into a custom character slot, replacing any
+        glyph loaded there before
 
         .. note:
             The image must be the same size as the font mode of the display.
         """
         assert img.size == (5, 8)
-        if len(self._custom) == self._const.CUSTOMCHARS:
-            # Max custom characters already reached
-            return
-        idx = 0
-        for _ in range(self._const.CUSTOMCHARS):
-            if idx not in self._custom.values():
-                break
-            idx += 1
-        assert idx < self._const.CUSTOMCHARS
+        assert 0 <= idx < self._const.CUSTOMCHARS
 
         self.command(self._const.CGRAMADDR + (idx * 8))
         data = [int(bool(i)) for i in img.getdata()]
@@ -1464,27 +2484,11 @@ class hd44780(backlit_device, parallel_device, character, __framebuffer_mixin):
             buf.append(sum(v << (4 - i) for i, v in
                 enumerate(data[j * 5:(j + 1) * 5])))
         self.data(buf)
-        self._custom[img.tobytes()] = idx
-
-    def _cleanup_custom(self, image):
-        """
-        Look across new image and remove any custom characters that are not
-        needed to render the image
-        """
-
-        # If no custom characters then we can exit without the search
-        if len(self._custom) == 0:
-            return
-
-        segments = self._get_segments(image, (0, 0, image.size[0], image.size[1]))
 
-        in_use = []
-        for x, y, line in segments:
-            for segment in line:
-                data = segment.tobytes()
-                if data in self._custom:
-                    in_use.append(data)
-        self._custom = {k: v for k, v in self._custom.items() if k in in_use}
+        self._custom.pop(self._cgram[idx], None)
+        self._cgram[idx] = img.tobytes()
+        self._custom[self._cgram[idx]] = idx
+        self._cgram_used[idx] = self._updates
 
     def get_font(self, ft):
         """
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Bulk encoders to convert PIL images into the native memory layout of the
+LCD controllers.
+"""
+
+from collections import namedtuple
+
+from PIL import Image
+
+__all__ = ["encoded_frame", "pages", "rgb565"]
+
+
+# The single transpose which takes an image, as drawn for a device with the
+# given rotate capability (0-3), to one where each row holds a column of the
+# device, bottom-most pixel first: i.e. the device's own rotation followed by
+# a further 90° clockwise turn. A full turn needs no transpose at all.
+_PAGE_TRANSPOSE = (
+    Image.Transpose.ROTATE_270,
+    Image.Transpose.ROTATE_180,
+    Image.Transpose.ROTATE_90,
+    None
+)
+
+# Per-band lookup tables to split RGB values into the high and low bytes of
+# a 5-6-5 pixel: red and the top of green, then the rest of green and blue.
+# The bits each band contributes to a byte never overlap, so summing the
+# bands combines them.
+_RGB565_HIGH = [v & 0xF8 for v in range(256)] + [v >> 5 for v in range(256)] + [0] * 256
+_RGB565_LOW = [0] * 256 + [(v << 3) & 0xE0 for v in range(256)] + [v >> 3 for v in range(256)]
+
+
+encoded_frame = namedtuple("encoded_frame", ["bbox", "window", "data", "image"])
+encoded_frame.__doc__ = """
+An image, or a region of one, already encoded into a device's native memory
+layout by its ``encode`` method, ready to be sent (any number of times) by
+its ``present`` method without further conversion.
+
+.. versionadded:: 2.14.0
+"""
+encoded_frame.bbox.__doc__ = """
+The ``(left, top, right, bottom)`` region covered, in the device's own
+(rotated) address space.
+"""
+encoded_frame.window.__doc__ = """
+The address window to write to: the region with any offsets applied.
+"""
+encoded_frame.data.__doc__ = "The encoded bytes, sent as is."
+encoded_frame.image.__doc__ = """
+The (rotated) image that was encoded, kept to update the framebuffer's
+record of the previous frame. This is ``None`` where the framebuffer tracks
+the encoded data itself (as with the monochrome displays), or where the
+image is not kept (as with :py:class:`luma.lcd.animation.animation`), in
+which case the next frame displayed is sent in full.
+"""
+
+
+def pages(image, rotate=0):
+    """
+    Packs a 1-bit image into page-major column bytes, as used by the
+    PCD8544 (where pages are known as banks), ST7567 and UC1701X controllers.
+
+    Each page covers 8 rows of pixels, and each byte within a page holds a
+    single column of those rows, with the least significant bit being the
+    top-most pixel.
+
+    Rather than iterating over every pixel, the image is transposed so that
+    the columns become rows, at which point PIL's own bit packing produces the
+    column bytes directly; they then only need to be sliced out page by page.
+
+    :param image: The 1-bit image to encode; the device height must be a
+        multiple of 8.
+    :type image: PIL.Image.Image
+    :param rotate: The device rotation (0-3) that the image was drawn for,
+        which is folded into the transpose, so there is no need to
+        :py:meth:`~luma.core.mixin.capabilities.preprocess` the image
+        beforehand.
+    :type rotate: int
+    :returns: ``width * height / 8`` bytes, ordered page by page.
+    :rtype: bytes
+    """
+    assert image.mode == "1"
+    method = _PAGE_TRANSPOSE[rotate]
+    if method is not None:
+        image = image.transpose(method)
+
+    # Row x now holds column x with the bottom-most pixel first, so the last
+    # byte on each row is page 0.
+    num_pages, rem = divmod(image.width, 8)
+    assert rem == 0
+    data = image.tobytes()
+    return b"".join(data[num_pages - 1 - page::num_pages] for page in range(num_pages))
+
+
+def rgb565(image):
+    """
+    Packs a 24-bit RGB image into 16-bit 5-6-5 pixels, as accepted by the
+    ST7735, ST7789 and ILI9341 controllers, dropping the least-significant
+    bits of each colour.
+
+    The high and low bytes are each built by a lookup table over the colour
+    bands followed by a matrix conversion to sum them, then interleaved as a
+    two band image, so the work stays inside PIL rather than iterating over
+    every pixel.
+
+    :param image: The RGB image to encode.
+    :type image: PIL.Image.Image
+    :returns: ``width * height * 2`` bytes, each pixel big-endian.
+    :rtype: bytes
+
+    .. versionadded:: 2.14.0
+    """
+    assert image.mode == "RGB"
+    high = image.point(_RGB565_HIGH).convert("L", (1, 1, 1, 0))
+    low = image.point(_RGB565_LOW).convert("L", (1, 1, 1, 0))
+    return Image.merge("LA", (high, low)).tobytes()
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Additional framebuffering strategies for the LCD displays.
+"""
+
+from PIL import ImageChops
+
+__all__ = ["page_diff", "tile_diff"]
+
+
+class page_diff(object):
+    """
+    Framebuffering strategy for the page-addressed monochrome displays. Rather
+    than comparing images, it keeps a shadow copy of the last transmitted
+    (encoded) page buffer, and works out which runs of columns within each
+    page have changed since then, so that only those need be sent.
+
+    Runs that are separated by fewer unchanged columns than it takes bytes to
+    re-address the controller are coalesced, as it is cheaper to resend the
+    unchanged columns in between.
+
+    :param fallback: When set (the default), the full frame is sent instead if
+        the changed runs, including the commands to address each of them,
+        would cost more bytes than a full frame would.
+    :type fallback: bool
+
+    The running total of bytes (commands and data) that did not need to be
+    sent, compared to sending every frame in full, is kept in
+    :py:attr:`bytes_saved`.
+
+    .. versionadded:: 2.14.0
+    """
+
+    def __init__(self, fallback=True):
+        self.fallback = fallback
+        self.prev_buf = None
+        self.bytes_saved = 0
+
+    def redraw(self, buf, width, overhead, frame_overhead):
+        """
+        Compares the encoded page buffer to the one previously sent.
+
+        .. note::
+            the first redraw will always render the full frame.
+
+        :param buf: The encoded page buffer, ``width`` bytes per page.
+        :type buf: bytes
+        :param width: The number of columns (bytes) per page.
+        :type width: int
+        :param overhead: The number of command bytes needed to address the
+            start of a run of columns.
+        :type overhead: int
+        :param frame_overhead: The number of command bytes needed to send the
+            full frame.
+        :type frame_overhead: int
+        :returns: A list of ``(page, start, end)`` column spans to send, which
+            is empty if nothing changed, or ``None`` if the full frame should
+            be sent.
+        :rtype: list
+        """
+        prev = self.prev_buf
+        self.prev_buf = bytes(buf)
+
+        if prev is None:
+            return None
+
+        spans = []
+        for page, offset in enumerate(range(0, len(buf), width)):
+            if buf[offset:offset + width] == prev[offset:offset + width]:
+                continue
+
+            start = end = None
+            for x in range(width):
+                if buf[offset + x] != prev[offset + x]:
+                    if start is None:
+                        start = x
+                    elif x - end > overhead:
+                        spans.append((page, start, end))
+                        start = x
+                    end = x + 1
+            spans.append((page, start, end))
+
+        cost = sum(overhead + end - start for _, start, end in spans)
+        full_cost = frame_overhead + len(buf)
+        if self.fallback and cost > full_cost:
+            return None
+
+        self.bytes_saved += full_cost - cost
+        return spans
+
+
+class tile_diff(object):
+    """
+    Framebuffering strategy for the large colour displays, which divides the
+    image into small square tiles and keeps a digest of each tile as it was
+    last sent, so that a change costs only the tiles it touches, rather than
+    a whole segment of a coarse grid.
+
+    Each band (row of tiles) is first digested as a whole, so only the tiles
+    of bands that changed need digesting and comparing individually. Within
+    those, each horizontal run of changed tiles is then narrowed to the
+    bounding box of the pixels that actually differ.
+
+    :param tile_size: The width and height of each tile, in pixels.
+    :type tile_size: int
+
+    .. versionadded:: 2.14.0
+    """
+
+    def __init__(self, tile_size=16):
+        assert tile_size > 0
+        self.tile_size = tile_size
+        self.prev_image = None
+        self._band_digests = []
+        self._tile_digests = []
+
+    def _digest_tiles(self, band):
+        size = self.tile_size
+        width, height = band.size
+        return [hash(band.crop((x, 0, min(x + size, width), height)).tobytes())
+                for x in range(0, width, size)]
+
+    def invalidate(self, bbox):
+        """
+        Marks the tiles within a bounding box as changed, for when that part of
+        :py:attr:`prev_image` has been updated other than through
+        :py:meth:`redraw`, so that they are compared pixel by pixel next time.
+
+        :param bbox: The ``(left, top, right, bottom)`` region.
+        :type bbox: tuple
+        """
+        size = self.tile_size
+        if self.prev_image is None:
+            return
+
+        # The previous image may have been set without digesting it
+        width, height = self.prev_image.size
+        bands = (height + size - 1) // size
+        if len(self._band_digests) != bands:
+            self._band_digests = [None] * bands
+            self._tile_digests = [[None] * ((width + size - 1) // size) for _ in range(bands)]
+
+        left, top, right, bottom = bbox
+        for band in range(top // size, min((bottom - 1) // size + 1, len(self._band_digests))):
+            self._band_digests[band] = None
+            tiles = self._tile_digests[band]
+            for tile in range(left // size, min((right - 1) // size + 1, len(tiles))):
+                tiles[tile] = None
+
+    def redraw(self, image):
+        """
+        Calculates the difference from the previous image, returning a sequence
+        of image sections and bounding boxes that changed since the previous
+        image.
+
+        .. note::
+            the first redraw will always render the full frame.
+
+        :param image: The image to render.
+        :type image: PIL.Image.Image
+        :returns: Yields a sequence of images and the bounding box for each
+            changed area.
+        :rtype: Generator[Tuple[PIL.Image.Image, Tuple[int, int, int, int]]]
+        """
+        size = self.tile_size
+        width, height = image.size
+        data = image.tobytes()
+        row_bytes = len(data) // height
+        band_digests = [hash(data[y * row_bytes:min(y + size, height) * row_bytes])
+                        for y in range(0, height, size)]
+
+        prev = self.prev_image
+        if prev is None or prev.size != image.size or prev.mode != image.mode:
+            self.prev_image = image.copy()
+            self._band_digests = band_digests
+            self._tile_digests = [self._digest_tiles(image.crop((0, y, width, min(y + size, height))))
+                                  for y in range(0, height, size)]
+            yield image, (0, 0) + image.size
+            return
+
+        changes = []
+        for band, y in enumerate(range(0, height, size)):
+            if band_digests[band] == self._band_digests[band]:
+                continue
+
+            bottom = min(y + size, height)
+            tile_digests = self._digest_tiles(image.crop((0, y, width, bottom)))
+            changed = [a != b for a, b in zip(tile_digests, self._tile_digests[band])]
+            self._band_digests[band] = band_digests[band]
+            self._tile_digests[band] = tile_digests
+
+            # Coalesce each run of changed tiles, then narrow it down
+            start = None
+            for tile, is_changed in enumerate(changed + [False]):
+                if is_changed and start is None:
+                    start = tile
+                elif not is_changed and start is not None:
+                    run = (start * size, y, min(tile * size, width), bottom)
+                    bbox = ImageChops.difference(prev.crop(run), image.crop(run)).getbbox()
+                    if bbox is not None:
+                        changes.append((run[0] + bbox[0], y + bbox[1], run[0] + bbox[2], y + bbox[3]))
+                    start = None
+
+        segments = [(image.crop(bbox), bbox) for bbox in changes]
+        for segment, bbox in segments:
+            prev.paste(segment, bbox[:2])
+        yield from segments
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Planning of the address windows used to send changed regions to the
+windowed colour displays.
+"""
+
+__all__ = ["window_planner"]
+
+
+def _area(bbox):
+    left, top, right, bottom = bbox
+    return max(0, right - left) * max(0, bottom - top)
+
+
+def _union(a, b):
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _contains(a, b):
+    return a[0] <= b[0] and a[1] <= b[1] and a[2] >= b[2] and a[3] >= b[3]
+
+
+def _subtract(a, b):
+    """
+    Splits rectangle ``a`` into the (up to four) rectangles that remain once
+    the area it shares with ``b`` is removed.
+    """
+    left, top, right, bottom = a
+    if b[0] >= right or b[2] <= left or b[1] >= bottom or b[3] <= top:
+        return [a]
+
+    pieces = []
+    if b[1] > top:
+        pieces.append((left, top, right, b[1]))
+        top = b[1]
+    if b[3] < bottom:
+        pieces.append((left, b[3], right, bottom))
+        bottom = b[3]
+    if b[0] > left:
+        pieces.append((left, top, b[0], bottom))
+    if b[2] < right:
+        pieces.append((b[2], top, right, bottom))
+    return pieces
+
+
+class window_planner(object):
+    """
+    Turns the changed regions reported by a framebuffer strategy into the
+    address windows to send, weighing the fixed cost of setting up each
+    window against the pixel data sent through it:
+
+    * regions lying within another are dropped,
+    * regions are merged whenever sending their combined bounding box is no
+      dearer than sending them apart (such as two nearby small regions),
+    * regions that overlap are split, when it is cheaper to send only the
+      parts not already covered than to send some pixels twice.
+
+    Comparing the regions pairwise takes time that grows steeply with their
+    number, so beyond ``max_regions`` they are not planned at all: either
+    their overall bounding box is sent, or, if that costs more, the regions
+    as reported.
+
+    :param overhead: The number of command and argument bytes needed to set
+        up a window (column & row address and memory write).
+    :type overhead: int
+    :param bytes_per_pixel: The number of bytes sent per pixel.
+    :type bytes_per_pixel: int
+    :param max_regions: The most regions to plan windows for.
+    :type max_regions: int
+
+    The most recent plan is kept in :py:attr:`last_plan`, and the running
+    total of bytes saved, compared to sending a window per region as
+    reported, in :py:attr:`bytes_saved`.
+
+    .. versionadded:: 2.14.0
+    """
+
+    def __init__(self, overhead, bytes_per_pixel, max_regions=32):
+        self.overhead = overhead
+        self.bytes_per_pixel = bytes_per_pixel
+        self.max_regions = max_regions
+        self.last_plan = []
+        self.bytes_saved = 0
+
+    def cost(self, bbox):
+        """
+        The number of bytes needed to send a single window.
+
+        :param bbox: The ``(left, top, right, bottom)`` window.
+        :type bbox: tuple
+        :rtype: int
+        """
+        return self.overhead + _area(bbox) * self.bytes_per_pixel
+
+    def plan(self, bounding_boxes):
+        """
+        Plans the windows to send for the given changed regions.
+
+        :param bounding_boxes: The ``(left, top, right, bottom)`` regions that
+            changed.
+        :type bounding_boxes: Iterable[tuple]
+        :returns: The windows to send.
+        :rtype: list
+        """
+        naive = [bbox for bbox in bounding_boxes if _area(bbox) > 0]
+        if len(naive) > self.max_regions:
+            return self._record(naive, self._bound(naive))
+
+        rects = list(naive)
+
+        merged = True
+        while merged:
+            merged = False
+            for i in range(len(rects)):
+                for j in range(i + 1, len(rects)):
+                    a, b = rects[i], rects[j]
+                    union = _union(a, b)
+                    if _contains(a, b) or _contains(b, a) or \
+                            self.cost(union) <= self.cost(a) + self.cost(b):
+                        rects[i] = union
+                        del rects[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+
+        windows = []
+        for rect in rects:
+            pieces = [rect]
+            for window in windows:
+                pieces = [piece for p in pieces for piece in _subtract(p, window)]
+            if sum(self.cost(p) for p in pieces) < self.cost(rect):
+                windows.extend(pieces)
+            else:
+                windows.append(rect)
+
+        return self._record(naive, windows)
+
+    def _bound(self, rects):
+        """
+        The single bounding box of all the regions, if that is no dearer to
+        send than the regions themselves, else the regions unchanged.
+        """
+        left, top, right, bottom = rects[0]
+        naive_cost = 0
+        for bbox in rects:
+            left, top = min(left, bbox[0]), min(top, bbox[1])
+            right, bottom = max(right, bbox[2]), max(bottom, bbox[3])
+            naive_cost += self.cost(bbox)
+        bbox = (left, top, right, bottom)
+        return [bbox] if self.cost(bbox) <= naive_cost else rects
+
+    def _record(self, naive, windows):
+        self.last_plan = windows
+        self.bytes_saved += sum(self.cost(r) for r in naive) - sum(self.cost(r) for r in windows)
+        return windows
+
+    def redraw(self, framebuffer, image):
+        """
+        Plans the windows for the regions that the framebuffer strategy
+        reports as changed, in the same way as (and as a drop-in replacement
+        for) the strategy's own ``redraw``.
+
+        :param framebuffer: The framebuffer strategy.
+        :type framebuffer: luma.core.framebuffer.framebuffer
+        :param image: The full (preprocessed) image to render.
+        :type image: PIL.Image.Image
+        :returns: Yields the image part and bounding box for each window.
+        :rtype: Generator[Tuple[PIL.Image.Image, Tuple[int, int, int, int]]]
+        """
+        segments = {bbox: segment for segment, bbox in framebuffer.redraw(image)}
+        for bbox in self.plan(segments):
+            # Windows left as reported can use the strategy's own image part
+            segment = segments.get(bbox)
+            yield (image.crop(bbox) if segment is None else segment), bbox
@@ -16,6 +16,7 @@ def setup_function(function):
     """
     serial.reset_mock()
     serial.command.side_effect = None
+    serial.data.side_effect = None
 
 
 def assert_invalid_dimensions(deviceType, serial_interface, width, height):
@@ -26,3 +27,22 @@ def assert_invalid_dimensions(deviceType, serial_interface, width, height):
     with pytest.raises(luma.core.error.DeviceDisplayModeError) as ex:
         deviceType(serial_interface, gpio=Mock(), width=width, height=height)
     assert f"Unsupported display mode: {width} x {height}" in str(ex.value)
+
+
+def data_calls(mock):
+    """
+    Returns the data sent through a mocked serial interface, call by call,
+    as lists; the devices may send any sequence of bytes, such as ``bytes``
+    or a ``memoryview``.
+    """
+    return [list(c.args[0]) for c in mock.data.call_args_list]
+
+
+def fill_calls(pixel, count, chunk_size=4096):
+    """
+    Returns the data sent by ``fill_rect``, call by call, as lists, when
+    filling ``count`` pixels with the given encoded pixel.
+    """
+    chunk = len(pixel) * (chunk_size // len(pixel))
+    data = pixel * count
+    return [data[i:i + chunk] for i in range(0, len(data), chunk)]
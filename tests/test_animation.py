@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Tests for the :py:mod:`luma.lcd.animation` module.
+"""
+
+import io
+
+import pytest
+
+from luma.core.framebuffer import full_frame
+from luma.lcd.animation import animation
+from luma.lcd.device import st7735, st7789
+from PIL import Image, ImageDraw
+
+from helpers import serial, setup_function, data_calls  # noqa: F401
+from unittest.mock import Mock, call, patch
+
+
+def bouncing_ball(size, num_frames):
+    frames = []
+    for i in range(num_frames):
+        frame = Image.new("RGB", size, "navy")
+        draw = ImageDraw.Draw(frame)
+        draw.ellipse((10 + i * 8, 20, 25 + i * 8, 35), fill="yellow")
+        draw.text((2, 2), str(i), fill="white")
+        frames.append(frame)
+    return frames
+
+
+def replay(frames, steps):
+    """
+    Applies the (RGB666, unrotated and unoffset) window updates for each
+    step, returning the display contents after each.
+    """
+    screen = Image.new("RGB", frames[0].size)
+    shown = []
+    for step in steps:
+        for update in step:
+            left, top, right, bottom = update.window
+            screen.paste(Image.frombytes("RGB", (right - left, bottom - top), update.data), update.window)
+        shown.append(screen.copy())
+    return shown
+
+
+def test_compile():
+    device = st7735(serial, gpio=Mock())
+    frames = bouncing_ball(device.size, 4)
+    anim = animation.compile(device, frames)
+
+    assert len(anim.steps) == 5
+    assert anim.steps[0][0].bbox == (0, 0) + device.size
+    for shown, expected in zip(replay(frames, anim.steps), frames + frames[:1]):
+        assert shown.tobytes() == expected.tobytes()
+
+    # Each change is smaller than the frame
+    for step in anim.steps[1:]:
+        assert sum(len(update.data) for update in step) < 160 * 128 * 3 // 4
+
+
+def test_compile_converts_frames():
+    device = st7735(serial, gpio=Mock(), pixel_format="rgb565", rotate=1)
+    frames = [Image.new("L", device.size, 0), Image.new("L", device.size, 255)]
+    anim = animation.compile(device, frames)
+    assert anim.steps[1][0].data == b"\xff" * (128 * 160 * 2)
+    assert anim.steps[0][0].window == (0, 0, 160, 128)
+
+
+def test_compile_invalid_size():
+    device = st7735(serial, gpio=Mock())
+    with pytest.raises(AssertionError):
+        animation.compile(device, [Image.new("RGB", (10, 10))])
+
+
+def test_play():
+    device = st7735(serial, gpio=Mock())
+    frames = bouncing_ball(device.size, 3)
+    anim = animation.compile(device, frames, fps=20)
+    serial.reset_mock()
+
+    clock = [100.0]
+    with patch("luma.lcd.animation.monotonic", side_effect=lambda: clock[0]), \
+            patch("luma.lcd.animation.sleep") as sleep:
+        anim.play(loops=2)
+
+    # Frames 0, 1, 2, 0 (as a wrap), 1, 2, each paced to 50ms
+    expected = [list(update.data) for i in [0, 1, 2, 3, 1, 2] for update in anim.steps[i]]
+    assert [data for data in data_calls(serial) if len(data) != 4] == expected
+    assert sleep.call_args_list == [call(pytest.approx(0.05 * n)) for n in range(1, 7)]
+
+
+def test_play_resyncs_framebuffer():
+    device = st7735(serial, gpio=Mock())
+    frames = bouncing_ball(device.size, 2)
+    anim = animation.compile(device, frames)
+
+    with patch("luma.lcd.animation.sleep"):
+        anim.play()
+
+    # The framebuffer no longer knows what is on display, so sends it all
+    serial.reset_mock()
+    device.display(frames[0])
+    assert data_calls(serial)[-1] == list(frames[0].tobytes())
+
+
+def test_save_load():
+    device = st7789(serial, gpio=Mock(), framebuffer=full_frame())
+    anim = animation.compile(device, bouncing_ball(device.size, 3), fps=12.5)
+
+    fp = io.BytesIO()
+    anim.save(fp)
+    fp.seek(0)
+    loaded = animation.load(device, fp)
+
+    assert loaded.fps == 12.5
+    assert loaded.steps == anim.steps
+
+
+def test_load_invalid():
+    device = st7735(serial, gpio=Mock())
+    with pytest.raises(ValueError) as ex:
+        animation.load(device, io.BytesIO(b"GIF89a" + bytes(64)))
+    assert "Not a compiled animation" in str(ex.value)
+
+
+def compiled(device):
+    fp = io.BytesIO()
+    animation.compile(device, bouncing_ball(device.size, 3)).save(fp)
+    return fp.getvalue()
+
+
+def test_load_truncated():
+    device = st7735(serial, gpio=Mock())
+    data = compiled(device)
+    for size in (10, len(data) // 2, len(data) - 1):
+        with pytest.raises(ValueError) as ex:
+            animation.load(device, io.BytesIO(data[:size]))
+        assert "Truncated animation" in str(ex.value)
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(pixel_format="rgb565"),
+    dict(rotate=2),
+    dict(h_offset=2, v_offset=1),
+])
+def test_load_different_configuration(kwargs):
+    data = compiled(st7735(serial, gpio=Mock()))
+    device = st7735(serial, gpio=Mock(), **kwargs)
+    with pytest.raises(ValueError) as ex:
+        animation.load(device, io.BytesIO(data))
+    assert "differently configured" in str(ex.value)
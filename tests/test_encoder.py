@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Tests for the :py:mod:`luma.lcd.encoder` module.
+"""
+
+import os
+import random
+from timeit import timeit
+
+import pytest
+from PIL import Image
+
+from luma.lcd.encoder import pages, rgb565
+
+
+# Timings vary too much between machines to be asserted on, so benchmarks
+# only report their numbers, when asked to
+benchmark = pytest.mark.skipif(not os.environ.get("LUMA_BENCHMARK"),
+                               reason="set LUMA_BENCHMARK=1 to run benchmarks")
+
+
+def report_fps(capsys, name, reference, encoder, number=20):
+    before = timeit(reference, number=number)
+    after = timeit(encoder, number=number)
+    with capsys.disabled():
+        print(f"\n{name}: {number / before:.0f} fps before, {number / after:.0f} fps after")
+
+
+def random_image(width, height, seed=1234):
+    rnd = random.Random(seed)
+    img = Image.new("1", (width, height))
+    img.putdata([rnd.choice((0, 255)) for _ in range(width * height)])
+    return img
+
+
+def pcd8544_reference(image):
+    """
+    The per-pixel bank packing loop previously used by the PCD8544 driver.
+    """
+    w, h = image.size
+    mask = [1 << (i // w) % 8 for i in range(w * h)]
+    offsets = [(w * (i // (w * 8))) + (i % w) for i in range(w * h)]
+    buf = bytearray(w * h // 8)
+    for idx, pix in enumerate(image.getdata()):
+        if pix > 0:
+            buf[offsets[idx]] |= mask[idx]
+    return bytes(buf)
+
+
+def page_reference(image):
+    """
+    The per-column page packing loop previously used by the ST7567 and
+    UC1701X drivers.
+    """
+    width, height = image.size
+    image_data = image.getdata()
+    pixels_per_page = width * 8
+    buf = bytearray(width)
+    result = bytearray()
+
+    for y in range(0, height // 8 * pixels_per_page, pixels_per_page):
+        offsets = [y + width * i for i in range(8)]
+
+        for x in range(width):
+            buf[x] = \
+                (image_data[x + offsets[0]] and 0x01) | \
+                (image_data[x + offsets[1]] and 0x02) | \
+                (image_data[x + offsets[2]] and 0x04) | \
+                (image_data[x + offsets[3]] and 0x08) | \
+                (image_data[x + offsets[4]] and 0x10) | \
+                (image_data[x + offsets[5]] and 0x20) | \
+                (image_data[x + offsets[6]] and 0x40) | \
+                (image_data[x + offsets[7]] and 0x80)
+
+        result += buf
+    return bytes(result)
+
+
+def test_pages_blank():
+    assert pages(Image.new("1", (84, 48))) == bytes(84 * 48 // 8)
+
+
+def test_pages_single_pixel():
+    img = Image.new("1", (84, 48))
+    img.putpixel((5, 11), 1)
+    expected = bytearray(84 * 48 // 8)
+    expected[84 + 5] = 0x08
+    assert pages(img) == expected
+
+
+def test_pages_matches_pcd8544_reference():
+    for seed in range(5):
+        img = random_image(84, 48, seed)
+        assert pages(img) == pcd8544_reference(img)
+
+
+@benchmark
+def test_pages_benchmark_pcd8544(capsys):
+    img = random_image(84, 48)
+    report_fps(capsys, "pcd8544 84x48", lambda: pcd8544_reference(img), lambda: pages(img))
+
+
+def test_pages_folds_rotation():
+    for rotate in range(4):
+        width, height = (84, 48) if rotate % 2 == 0 else (48, 84)
+        img = random_image(width, height, rotate)
+        native = img.rotate(rotate * -90, expand=True)
+        assert pages(img, rotate) == pcd8544_reference(native)
+
+
+def test_pages_matches_page_reference():
+    for seed in range(5):
+        img = random_image(128, 64, seed)
+        assert pages(img) == page_reference(img)
+
+
+@benchmark
+def test_pages_benchmark_128x64(capsys):
+    img = random_image(128, 64)
+    report_fps(capsys, "st7567/uc1701x 128x64", lambda: page_reference(img), lambda: pages(img))
+
+
+def random_rgb_image(width, height, seed=1234):
+    rnd = random.Random(seed)
+    img = Image.new("RGB", (width, height))
+    img.frombytes(bytes(rnd.randrange(256) for _ in range(width * height * 3)))
+    return img
+
+
+def rgb565_reference(image):
+    """
+    Per-pixel 5-6-5 packing, for comparison.
+    """
+    buf = bytearray()
+    for r, g, b in zip(*[iter(image.tobytes())] * 3):
+        value = (r & 0xF8) << 8 | (g & 0xFC) << 3 | b >> 3
+        buf += value.to_bytes(2, "big")
+    return bytes(buf)
+
+
+def test_rgb565_primaries():
+    img = Image.new("RGB", (4, 1))
+    img.putdata([(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)])
+    assert rgb565(img) == bytes([0xF8, 0x00, 0x07, 0xE0, 0x00, 0x1F, 0xFF, 0xFF])
+
+
+def test_rgb565_matches_reference():
+    for seed in range(5):
+        img = random_rgb_image(160, 128, seed)
+        assert rgb565(img) == rgb565_reference(img)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Tests for the :py:mod:`luma.lcd.framebuffer` module.
+"""
+
+from PIL import Image
+
+from luma.lcd.framebuffer import page_diff, tile_diff
+
+
+def test_page_diff_first_redraw_is_full_frame():
+    fb = page_diff()
+    assert fb.redraw(bytes(16), 8, 2, 3) is None
+
+
+def test_page_diff_unchanged():
+    fb = page_diff()
+    fb.redraw(bytes(16), 8, 2, 3)
+    assert fb.redraw(bytes(16), 8, 2, 3) == []
+
+
+def test_page_diff_runs():
+    fb = page_diff(fallback=False)
+    fb.redraw(bytes(16), 8, 2, 3)
+    buf = bytes([1, 0, 0, 0, 1, 0, 0, 0,
+                 0, 0, 1, 0, 1, 1, 0, 0])
+    # Columns 0 and 4 are too far apart to share an address command, whereas
+    # resending column 11 is cheaper than addressing column 12 separately
+    assert fb.redraw(buf, 8, 2, 3) == [(0, 0, 1), (0, 4, 5), (1, 2, 6)]
+
+
+def test_page_diff_fallback():
+    fb = page_diff()
+    fb.redraw(bytes(16), 8, 2, 3)
+    assert fb.redraw(bytes([0xff] * 16), 8, 2, 3) is None
+
+    fb = page_diff(fallback=False)
+    fb.redraw(bytes(16), 8, 2, 3)
+    assert fb.redraw(bytes([0xff] * 16), 8, 2, 3) == [(0, 0, 8), (1, 0, 8)]
+
+
+def test_page_diff_bytes_saved():
+    fb = page_diff()
+    fb.redraw(bytes(16), 8, 2, 3)
+    assert fb.bytes_saved == 0
+
+    fb.redraw(bytes(16), 8, 2, 3)
+    assert fb.bytes_saved == 19
+
+    buf = bytes([0, 0, 0, 0, 0, 0, 0, 0,
+                 0, 0, 1, 1, 0, 0, 0, 0])
+    fb.redraw(buf, 8, 2, 3)
+    assert fb.bytes_saved == 19 + 19 - 4
+
+
+def test_tile_diff_first_redraw_is_full_frame():
+    fb = tile_diff()
+    image = Image.new("RGB", (40, 30))
+    assert list(fb.redraw(image)) == [(image, (0, 0, 40, 30))]
+    assert fb.prev_image.tobytes() == image.tobytes()
+
+
+def test_tile_diff_unchanged():
+    fb = tile_diff()
+    list(fb.redraw(Image.new("RGB", (40, 30))))
+    assert list(fb.redraw(Image.new("RGB", (40, 30)))) == []
+
+
+def test_tile_diff_tight_bounding_box():
+    fb = tile_diff(tile_size=8)
+    image = Image.new("RGB", (40, 30))
+    list(fb.redraw(image))
+
+    # A change across two tiles in one band, and one in the last (partial)
+    # band, narrowed down to the pixels that changed
+    image = image.copy()
+    image.paste((255, 0, 0), (6, 2, 10, 4))
+    image.putpixel((39, 29), (0, 0, 255))
+    changes = list(fb.redraw(image))
+    assert [bbox for _, bbox in changes] == [(6, 2, 10, 4), (39, 29, 40, 30)]
+    assert list(changes[1][0].tobytes()) == [0, 0, 255]
+    assert fb.prev_image.tobytes() == image.tobytes()
+
+
+def test_tile_diff_separate_runs():
+    fb = tile_diff(tile_size=8)
+    list(fb.redraw(Image.new("RGB", (40, 8))))
+
+    image = Image.new("RGB", (40, 8))
+    image.putpixel((1, 1), (1, 1, 1))
+    image.putpixel((33, 1), (1, 1, 1))
+    assert [bbox for _, bbox in fb.redraw(image)] == [(1, 1, 2, 2), (33, 1, 34, 2)]
+
+
+def test_tile_diff_size_change():
+    fb = tile_diff()
+    list(fb.redraw(Image.new("RGB", (40, 30))))
+    image = Image.new("RGB", (30, 40))
+    assert list(fb.redraw(image)) == [(image, (0, 0, 30, 40))]
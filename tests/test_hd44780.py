@@ -7,16 +7,21 @@
 Tests for the :py:class:`luma.lcd.device.hd44780` device.
 """
 
+import luma.core.error
 from luma.lcd.device import hd44780
 from luma.core.render import canvas
 from luma.core.util import bytes_to_nibbles
 from luma.core.framebuffer import full_frame, diff_to_previous
+from luma.core.interface.parallel import bitbang_6800
+from luma.core.bitmap_font import load_sprite_table
+from luma.core.virtual import character
 from luma.lcd.const import hd44780 as CONST
 from luma.lcd.big_digits import device as big_digits
 from pathlib import Path
 
 from PIL import Image, ImageDraw
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
+import pytest
 
 interface = Mock(unsafe=True, _bitmode=4)
 gpio = Mock()
@@ -118,7 +123,8 @@ def test_display():
     # Print the resulting custom characters to form the image of the scrollbar
     line2 = [call.command(0xc0), call.data([0x20, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x01, 0x01, 0x02, 0x20, 0x20])]
 
-    interface.assert_has_calls(line1 + custom + line2)
+    # The custom characters are made before any of the text is written
+    interface.assert_has_calls(custom + line1 + line2)
 
 
 def test_custom_full():
@@ -285,3 +291,293 @@ def test_big_digits():
     interface.assert_has_calls([call.command(CONST.CGRAMADDR), call.data([0x1f, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x1f]),
                                call.command(CONST.CGRAMADDR + 8), call.data([0x1f, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1f]),
                                call.command(CONST.CGRAMADDR + 16), call.data([0x1f, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x1f])], any_order=True)
+
+
+def image_path_calls(device, text):
+    """
+    The calls made when text is rendered to an image and matched back to
+    the font's glyphs.
+    """
+    interface.reset_mock()
+    character._flush(device, text)
+    return list(interface.mock_calls)
+
+
+def text_path_calls(device, text):
+    interface.reset_mock()
+    device.text = text
+    return list(interface.mock_calls)
+
+
+def test_text_matches_image_path():
+    printable = ''.join(chr(c) for c in range(0x20, 0x7F))
+    texts = [
+        'Hello\nWorld',
+        printable[:16] + '\n' + printable[16:32],
+        printable[32:48] + '\n' + printable[48:64],
+        printable[64:80] + '\n' + printable[80:],
+        'Too long for one line\nand\nthree lines',
+        'Missing ￿ glyph\néüß¥ →←',
+        '\n',
+        ''
+    ]
+    for font in ['A00', 'A02']:
+        device = hd44780(interface, bitmode=8, gpio=gpio, framebuffer=full_frame(), selected_font=font)
+        for text in texts:
+            assert text_path_calls(device, text) == image_path_calls(device, text)
+
+
+def test_text_does_not_render():
+    device = hd44780(interface, bitmode=8, gpio=gpio)
+    with patch('luma.core.virtual.canvas') as render:
+        device.text = 'No rendering\nat all'
+    render.assert_not_called()
+    assert [ord(c) for c in 'rendering'] in [c.args[0] for c in interface.data.call_args_list]
+
+
+def test_text_custom_glyph():
+    star = Image.new('1', (5, 8))
+    star.putpixel((2, 3), 1)
+    font = load_sprite_table(star, [0x2605], 5, (5, 8), (5, 8), {0x2605: 0x2605})
+
+    calls = []
+    for path in [text_path_calls, image_path_calls]:
+        device = hd44780(interface, bitmode=8, gpio=gpio, framebuffer=full_frame())
+        device.font.combine(font)
+        calls.append(path(device, '★ A ★'))
+    assert calls[0] == calls[1]
+
+    calls = calls[0]
+    assert call.command(0x40) in calls
+    assert call.data([0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00]) in calls
+    assert call.data([0x00, 0x20, 0x41, 0x20, 0x00] + [0x20] * 11) in calls
+
+
+def test_text_sends_changed_cells():
+    device = hd44780(interface, bitmode=8, gpio=gpio)
+    device.text = '12:00\nAlarm off'
+    interface.reset_mock()
+
+    # Only the runs of changed cells are addressed and written
+    device.text = '12:01\nAlarm on'
+    assert interface.mock_calls == [
+        call.command(0x84), call.data([ord('1')]),
+        call.command(0xC7), call.data([ord('n'), 0x20])
+    ]
+
+    # One digit changing costs one address command and one data write
+    interface.reset_mock()
+    device.text = '12:02\nAlarm on'
+    assert interface.mock_calls == [call.command(0x84), call.data([ord('2')])]
+
+    # Nothing changing costs nothing
+    interface.reset_mock()
+    device.text = '12:02\nAlarm on'
+    assert interface.mock_calls == []
+
+
+def test_display_sends_changed_cells():
+    device = hd44780(interface, bitmode=8, gpio=gpio)
+    device.text = 'Hello'
+    interface.reset_mock()
+
+    with canvas(device) as draw:
+        draw.text((0, 0), 'Help', font=device.font, fill='white')
+
+    assert interface.mock_calls == [call.command(0x83), call.data([ord('p'), 0x20])]
+
+
+def test_writes_follow_address_order():
+    device = hd44780(interface, bitmode=8, gpio=gpio, width=20, height=4)
+    interface.reset_mock()
+
+    # The end of the first line runs on into the third in display memory
+    device.text = ' ' * 19 + 'A\n\nB'
+    assert interface.mock_calls == [call.command(0x93), call.data([ord('A'), ord('B')])]
+
+
+def glyphs(*cells):
+    """
+    An image for a 16x2 display with the custom glyph numbered n (a bar n
+    pixels high, or a diagonal line for 8 and 9) in each cell given as
+    ``(column, n)``.
+    """
+    img = Image.new('1', (80, 16))
+    drw = ImageDraw.Draw(img)
+    for x, n in cells:
+        if n < 8:
+            drw.rectangle((x * 5, 0, x * 5 + 3, n), fill='white')
+        else:
+            drw.line((x * 5, n - 8, x * 5 + 4, 15 - n), fill='white')
+    return img
+
+
+def cgram_writes():
+    return [c.args[0] for c in interface.command.call_args_list if 0x40 <= c.args[0] < 0x80]
+
+
+def test_custom_reused_once_loaded():
+    device = hd44780(interface, bitmode=8, gpio=gpio)
+    device.display(glyphs((0, 0), (1, 1)))
+    device.display(glyphs())
+    interface.reset_mock()
+
+    # Both glyphs are still loaded, so are not written again
+    device.display(glyphs((5, 1), (6, 0)))
+    assert cgram_writes() == []
+    interface.assert_has_calls([call.command(0x85), call.data([1, 0])])
+
+
+def test_custom_evicts_least_recently_used():
+    device = hd44780(interface, bitmode=8, gpio=gpio)
+    device.display(glyphs(*[(n, n) for n in range(8)]))
+    interface.reset_mock()
+
+    # All slots are in use
+    device.display(glyphs(*[(n, n) for n in range(8)], (8, 8)))
+    assert cgram_writes() == []
+    interface.assert_has_calls([call.command(0x88), call.data([ord('_')])])
+
+    # Slot 0 is used again more recently than the rest
+    device.display(glyphs((0, 0)))
+    interface.reset_mock()
+
+    device.display(glyphs((0, 0), (1, 8), (2, 9)))
+    assert cgram_writes() == [0x48, 0x50]
+    interface.assert_has_calls([call.command(0x81), call.data([1, 2])])
+
+
+def test_custom_slot_freed_by_overwrite():
+    device = hd44780(interface, bitmode=8, gpio=gpio)
+    device.display(glyphs(*[(n, n) for n in range(8)]))
+    interface.reset_mock()
+
+    # Replacing the last cell using a slot frees it in the same update, and
+    # as the cell keeps the same code, only the glyph need be written
+    device.display(glyphs(*[(n, n) for n in range(7)], (7, 8)))
+    assert interface.mock_calls == [call.command(0x78), call.data([0x10, 0x08, 0x08, 0x04, 0x04, 0x02, 0x02, 0x01])]
+
+
+class busy_gpio(object):
+    """
+    Stands in for RPi.GPIO, simulating a controller that stays busy for a
+    number of busy flag reads after each write strobe.
+    """
+    LOW = 0
+    HIGH = 1
+    OUT = 'out'
+    IN = 'in'
+    RW = 5
+    E = 17
+
+    def __init__(self, busy_for):
+        self.busy_for = busy_for
+        self.remaining = 0
+        self.reads = 0
+        self.levels = {}
+        self.directions = {}
+
+    def setwarnings(self, flag):
+        pass
+
+    def setmode(self, mode):
+        pass
+
+    def setup(self, pin, direction, **kwargs):
+        self.directions[pin] = direction
+
+    def output(self, pin, value):
+        strobe = pin == self.E and value == self.LOW and self.levels.get(pin) == self.HIGH
+        self.levels[pin] = value
+        if strobe and self.levels.get(self.RW, self.LOW) == self.LOW:
+            self.remaining = self.busy_for
+
+    def input(self, pin):
+        assert self.directions[pin] == self.IN and self.levels[self.RW] == self.HIGH
+        self.reads += 1
+        busy = self.remaining > 0
+        self.remaining -= 1
+        return busy
+
+
+def busy_device(busy_for, pins=(25, 24, 23, 18), **kwargs):
+    sim = busy_gpio(busy_for)
+    bus = bitbang_6800(gpio=sim, pulse_time=0, PINS=list(pins))
+    return sim, hd44780(bus, gpio=Mock(), gpio_RW=busy_gpio.RW, **kwargs)
+
+
+def test_busy_flag_polling():
+    sim, device = busy_device(3)
+    assert sim.levels[busy_gpio.RW] == busy_gpio.LOW
+    device.data([0x20])
+    sim.reads = 0
+
+    with patch('luma.lcd.device.sleep') as sleep:
+        device.command(CONST.CLEAR)
+        assert sim.reads == 0
+        device.data([0x41])
+    sleep.assert_not_called()
+
+    # Polling stops at the first read after the controller goes idle, and
+    # the bus is handed back for writing
+    assert sim.reads == 4
+    assert sim.levels[busy_gpio.RW] == busy_gpio.LOW
+    assert all(sim.directions[pin] == busy_gpio.OUT for pin in (25, 24, 23, 18))
+
+
+def test_busy_flag_polling_8bitmode():
+    sim, device = busy_device(2, pins=(25, 24, 23, 18, 4, 27, 10, 9))
+    device.data([0x20])
+    sim.reads = 0
+    device.text = 'Hi'
+    assert sim.reads == 3
+
+
+def test_busy_flag_timeout():
+    sim, device = busy_device(10 ** 9, busy_timeout=0)
+    device.data([0x20])
+    sim.reads = 0
+    device.command(CONST.CLEAR)
+    device.command(CONST.HOME)
+    assert sim.reads == 1
+
+
+def test_exec_time_waited_before_next_write():
+    with patch('luma.lcd.device.monotonic', return_value=0.0), \
+            patch('luma.lcd.device.sleep'):
+        device = hd44780(interface, gpio=gpio, exec_time=1e-3)
+
+    with patch('luma.lcd.device.monotonic', return_value=50.0), \
+            patch('luma.lcd.device.sleep') as sleep:
+        device.command(CONST.CLEAR, exec_time=2e-3)
+        sleep.assert_not_called()
+
+        # Only what is left of the execution time is waited for
+        with patch('luma.lcd.device.monotonic', side_effect=[50.0005, 50.002]):
+            device.data([0x41])
+            assert sleep.call_count == 1
+            assert abs(sleep.call_args[0][0] - 0.0015) < 1e-9
+
+            # Data writes do not themselves wait, so a further one goes straight out
+            device.data([0x42])
+            assert sleep.call_count == 1
+
+        # Nor is there any wait once the deadline has passed
+        with patch('luma.lcd.device.monotonic', side_effect=[50.005, 50.005, 50.01, 50.01]):
+            device.command(CONST.HOME)
+            device.command(CONST.HOME)
+        assert sleep.call_count == 1
+
+
+def test_busy_flag_requires_bitbang():
+    with pytest.raises(luma.core.error.UnsupportedPlatform) as ex:
+        hd44780(interface, gpio=gpio, gpio_RW=5)
+    assert 'bitbang_6800' in str(ex.value)
+
+
+def test_busy_flag_requires_bus_access():
+    bus = bitbang_6800(gpio=busy_gpio(0), pulse_time=0)
+    del bus._PINS
+    with pytest.raises(luma.core.error.UnsupportedPlatform) as ex:
+        hd44780(bus, gpio=Mock(), gpio_RW=busy_gpio.RW)
+    assert '_PINS' in str(ex.value)
@@ -187,9 +187,10 @@ def test_display():
 
     sevensegment(device).text = "HELLO"
 
+    # The blank frame drawn first is identical to the initial clear, so is
+    # skipped
+    assert device.skipped_frames == 1
     assert gpio.get_data() == [
-        gpio.data(0), gpio.data(0), gpio.data(0),     # _ _ _
-        gpio.data(0), gpio.data(0), gpio.data(0),     # _ _ _
         gpio.data(0), gpio.data(125), gpio.data(13),  # _ O L
         gpio.data(13), gpio.data(31), gpio.data(103)  # L E H
     ]
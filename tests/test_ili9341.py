@@ -14,7 +14,7 @@ from luma.core.render import canvas
 from luma.core.framebuffer import full_frame
 
 from baseline_data import get_reference_data, primitives
-from helpers import serial, setup_function, assert_invalid_dimensions  # noqa: F401
+from helpers import serial, setup_function, assert_invalid_dimensions, data_calls, fill_calls  # noqa: F401
 from unittest.mock import Mock
 
 
@@ -22,7 +22,7 @@ def test_init_320x240():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -59,7 +59,7 @@ def test_init_320x240():
         {'command': [0x2a]}, {'data': [0x00, 0x00, 0x01, 0x3f]},
         {'command': [0x2b]}, {'data': [0x00, 0x00, 0x00, 0xef]},
         {'command': [0x2c]},
-        {'data': bytearray([0x00] * (320 * 240 * 3))},
+        *[{'data': d} for d in fill_calls([0x00] * 3, 320 * 240)],
         {'command': [0x29]},
     ]
 
@@ -68,7 +68,7 @@ def test_init_240x240():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -105,7 +105,7 @@ def test_init_240x240():
         {'command': [0x2A]}, {'data': [0x00, 0x00, 0x00, 0xef]},
         {'command': [0x2B]}, {'data': [0x00, 0x00, 0x00, 0xef]},
         {'command': [0x2C]},
-        {'data': bytearray([0x00] * (240 * 240 * 3))},
+        *[{'data': d} for d in fill_calls([0x00] * 3, 240 * 240)],
         {'command': [0x29]},
     ]
 
@@ -114,7 +114,7 @@ def test_init_320x180():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -151,7 +151,7 @@ def test_init_320x180():
         {'command': [0x2A]}, {'data': [0x00, 0x00, 0x01, 0x3f]},
         {'command': [0x2B]}, {'data': [0x00, 0x00, 0x00, 0xb3]},
         {'command': [0x2C]},
-        {'data': bytearray([0x00] * (320 * 180 * 3))},
+        *[{'data': d} for d in fill_calls([0x00] * 3, 320 * 180)],
         {'command': [0x29]},
     ]
 
@@ -168,7 +168,7 @@ def test_offsets():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -205,11 +205,19 @@ def test_offsets():
         {'command': [0x2A]}, {'data': [0x00, 0x02, 0x00, 0xef + 0x02]},
         {'command': [0x2B]}, {'data': [0x00, 0x01, 0x00, 0xef + 0x01]},
         {'command': [0x2C]},
-        {'data': bytearray([0x00] * (240 * 240 * 3))},
+        *[{'data': d} for d in fill_calls([0x00] * 3, 240 * 240)],
         {'command': [0x29]},
     ]
 
 
+def test_init_rgb565():
+    ili9341(serial, gpio=Mock(), framebuffer=full_frame(), pixel_format="rgb565")
+    serial.command.assert_any_call(0x3a)
+    assert [0x55] in data_calls(serial)
+    expected = fill_calls([0x00] * 2, 320 * 240)
+    assert data_calls(serial)[-len(expected):] == expected
+
+
 def test_contrast():
     device = ili9341(serial, gpio=Mock())
     serial.reset_mock()
@@ -259,3 +267,16 @@ def test_display_full_frame():
     # save_reference_data("demo_ili9341", recordings)
 
     assert recordings == get_reference_data('demo_ili9341')
+
+
+def test_display_planned_windows():
+    device = ili9341(serial, gpio=Mock())
+    serial.reset_mock()
+
+    # Either side of the boundary between two segments, sent as one window
+    with canvas(device) as draw:
+        draw.point((63, 0), fill="white")
+        draw.point((65, 0), fill="white")
+
+    assert device.planner.last_plan == [(63, 0, 66, 1)]
+    assert data_calls(serial) == [[0, 63, 0, 65], [0, 0, 0, 0], [255] * 3 + [0] * 3 + [255] * 3]
@@ -14,7 +14,7 @@ from luma.core.render import canvas
 from luma.core.framebuffer import full_frame
 
 from baseline_data import get_reference_data, primitives
-from helpers import serial, setup_function, assert_invalid_dimensions  # noqa: F401
+from helpers import serial, setup_function, assert_invalid_dimensions, fill_calls  # noqa: F401
 from unittest.mock import Mock
 
 
@@ -22,7 +22,7 @@ def test_init_320x480():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -55,7 +55,7 @@ def test_init_320x480():
         {'command': [0x2a]}, {'data': [0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x3f]},
         {'command': [0x2b]}, {'data': [0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0xdf]},
         {'command': [0x2c]},
-        {'data': bytearray([0x00] * (320 * 480 * 3))},
+        *[{'data': d} for d in fill_calls([0x00] * 3, 320 * 480)],
         {'command': [0x29]},
     ]
 
@@ -72,7 +72,7 @@ def test_offsets():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -103,7 +103,7 @@ def test_offsets():
         {'command': [0x2A]}, {'data': [0x00, 0x00, 0x00, 0x02, 0x00, 0x01, 0x00, 0x3f + 0x02]},
         {'command': [0x2B]}, {'data': [0x00, 0x00, 0x00, 0x01, 0x00, 0x01, 0x00, 0xdf + 0x01]},
         {'command': [0x2C]},
-        {'data': bytearray([0x00] * (320 * 480 * 3))},
+        *[{'data': d} for d in fill_calls([0x00] * 3, 320 * 480)],
         {'command': [0x29]},
     ]
 
@@ -7,14 +7,19 @@
 Tests for the :py:class:`luma.lcd.device.ili9488` device.
 """
 
+import tracemalloc
+
 import pytest
 
 from luma.lcd.device import ili9488
+from luma.core.interface.serial import noop
 from luma.core.render import canvas
 from luma.core.framebuffer import full_frame
+from luma.lcd.framebuffer import tile_diff
+from PIL import Image
 
 from baseline_data import get_reference_data, primitives
-from helpers import serial, setup_function, assert_invalid_dimensions  # noqa: F401
+from helpers import serial, setup_function, assert_invalid_dimensions, data_calls, fill_calls  # noqa: F401
 from unittest.mock import Mock
 
 
@@ -22,7 +27,7 @@ def test_init_480x320():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -53,7 +58,7 @@ def test_init_480x320():
         {'command': [0x2a]}, {'data': [0x00, 0x00, 0x01, 0xdf]},
         {'command': [0x2b]}, {'data': [0x00, 0x00, 0x01, 0x3f]},
         {'command': [0x2c]},
-        {'data': bytearray([0x00] * (480 * 320 * 3))},
+        *[{'data': d} for d in fill_calls([0x00] * 3, 480 * 320)],
         {'command': [0x29]},
     ]
 
@@ -70,7 +75,7 @@ def test_offsets():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -101,7 +106,7 @@ def test_offsets():
         {'command': [0x2a]}, {'data': [0x00, 0x02, 0x01, 0xdf + 0x02]},
         {'command': [0x2b]}, {'data': [0x00, 0x01, 0x01, 0x3f + 0x01]},
         {'command': [0x2c]},
-        {'data': bytearray([0x00] * (480 * 320 * 3))},
+        *[{'data': d} for d in fill_calls([0x00] * 3, 480 * 320)],
         {'command': [0x29]},
     ]
 
@@ -155,3 +160,56 @@ def test_display_full_frame():
     # save_reference_data("demo_ili9488", recordings)
 
     assert recordings == get_reference_data('demo_ili9488')
+
+
+def test_display_tile_diff():
+    device = ili9488(serial, gpio=Mock(), framebuffer=tile_diff())
+
+    recordings = []
+
+    def data(data):
+        recordings.append({'data': list(data)})
+
+    def command(*cmd):
+        recordings.append({'command': list(cmd)})
+
+    serial.command.side_effect = command
+    serial.data.side_effect = data
+
+    with canvas(device) as draw:
+        draw.point((100, 200), fill="white")
+
+    assert recordings == [
+        {'command': [0x2a]}, {'data': [0, 100, 0, 100]},
+        {'command': [0x2b]}, {'data': [0, 200, 0, 200]},
+        {'command': [0x2c]}, {'data': [255, 255, 255]}
+    ]
+
+
+def test_blit_tile_diff():
+    device = ili9488(serial, gpio=Mock(), framebuffer=tile_diff())
+    with canvas(device) as draw:
+        draw.rectangle((0, 0, 7, 7), fill="white")
+    device.blit(Image.new("RGB", (8, 8), "red"), (0, 0))
+    serial.reset_mock()
+
+    # Redrawing the rectangle overwrites the blitted tile, even though the
+    # tile's content is identical to what was last displayed (the window is
+    # still addressed from the blit)
+    with canvas(device) as draw:
+        draw.rectangle((0, 0, 7, 7), fill="white")
+
+    assert data_calls(serial) == [[255, 255, 255] * 64]
+
+
+def test_clear_allocations():
+    device = ili9488(noop(), gpio=Mock(), framebuffer=full_frame())
+
+    tracemalloc.start()
+    device.clear()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Streamed from a single small chunk, rather than encoding a full frame
+    frame_size = 480 * 320 * 3
+    assert peak < frame_size // 4
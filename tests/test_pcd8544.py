@@ -7,11 +7,16 @@
 Tests for the :py:class:`luma.lcd.device.pcd8544` device.
 """
 
+import pytest
+
 from luma.lcd.device import pcd8544
+from luma.lcd.encoder import pages
+from luma.lcd.framebuffer import page_diff
 from luma.core.render import canvas
+from PIL import Image
 
 from baseline_data import get_reference_data, primitives
-from helpers import serial, setup_function  # noqa: F401
+from helpers import serial, setup_function, data_calls  # noqa: F401
 from unittest.mock import Mock, call
 
 
@@ -25,7 +30,7 @@ def test_init_84x48():
 
     # Next 1024 are all data: zero's to clear the RAM
     # (1024 = 128 * 64 / 8)
-    serial.data.assert_called_once_with([0] * (84 * 48 // 8))
+    assert data_calls(serial) == [[0] * (84 * 48 // 8)]
 
 
 def test_hide():
@@ -42,6 +47,34 @@ def test_show():
     serial.command.assert_called_once_with(12)
 
 
+def test_invert():
+    device = pcd8544(serial, gpio=Mock())
+    serial.reset_mock()
+    device.invert(True)
+    device.invert(False)
+    assert serial.command.call_args_list == [call(13), call(12)]
+
+
+def test_all_on():
+    device = pcd8544(serial, gpio=Mock())
+    serial.reset_mock()
+    device.all_on(True)
+    device.all_on(False)
+    assert serial.command.call_args_list == [call(9), call(12)]
+
+
+def test_blank_restores_inverse_video():
+    device = pcd8544(serial, gpio=Mock())
+    device.invert(True)
+    serial.reset_mock()
+    device.blank(True)
+    device.blank(False)
+    device.hide()
+    device.show()
+    assert serial.command.call_args_list == [call(8), call(13), call(8), call(13)]
+    serial.data.assert_not_called()
+
+
 def test_display():
     device = pcd8544(serial, gpio=Mock())
     serial.reset_mock()
@@ -56,7 +89,112 @@ def test_display():
     # To regenerate test data, uncomment the following (remember not to commit though)
     # ================================================================================
     # from baseline_data import save_reference_data
-    # save_reference_data("demo_pcd8544", serial.data.call_args.args[0])
+    # save_reference_data("demo_pcd8544", list(serial.data.call_args.args[0]))
 
     # Next 1024 bytes are data representing the drawn image
-    serial.data.assert_called_once_with(get_reference_data('demo_pcd8544'))
+    assert data_calls(serial) == [get_reference_data('demo_pcd8544')]
+
+
+def test_display_partial_update():
+    device = pcd8544(serial, gpio=Mock(), framebuffer=page_diff())
+    serial.reset_mock()
+
+    img = Image.new("1", device.size)
+    img.putpixel((10, 9), 1)
+    img.putpixel((11, 9), 1)
+    img.putpixel((40, 47), 1)
+    device.display(img)
+
+    serial.command.assert_has_calls([call(0x41, 0x8A), call(0x45, 0xA8)])
+    assert data_calls(serial) == [[0x02, 0x02], [0x80]]
+    assert serial.command.call_count == 2
+
+    # An unchanged frame sends nothing at all
+    serial.reset_mock()
+    device.display(img)
+    serial.command.assert_not_called()
+    serial.data.assert_not_called()
+
+
+def test_display_partial_update_fallback():
+    device = pcd8544(serial, gpio=Mock(), framebuffer=page_diff())
+    serial.reset_mock()
+
+    # Addressing each of the banks separately costs more than a full frame
+    img = Image.new("1", device.size, "white")
+    device.display(img)
+
+    serial.command.assert_called_once_with(32, 128, 64)
+    assert data_calls(serial) == [list(pages(img))]
+
+
+def test_display_rotated():
+    device = pcd8544(serial, gpio=Mock(), rotate=1)
+    serial.reset_mock()
+
+    # Top-left corner of the rotated canvas is the top-right of the display
+    img = Image.new("1", device.size)
+    img.putpixel((0, 0), 1)
+    device.display(img)
+
+    expected = [0] * (84 * 48 // 8)
+    expected[83] = 0x01
+    assert data_calls(serial) == [list(expected)]
+
+
+def test_display_skips_unchanged_frame():
+    device = pcd8544(serial, gpio=Mock())
+    serial.reset_mock()
+
+    for _ in range(3):
+        with canvas(device) as draw:
+            draw.point((1, 1), fill="white")
+
+    assert len(data_calls(serial)) == 1
+    assert device.skipped_frames == 2
+
+
+def test_fill_pages():
+    device = pcd8544(serial, gpio=Mock())
+    serial.reset_mock()
+
+    device.fill_pages(0xFF)
+    serial.command.assert_called_once_with(32, 128, 64)
+    assert data_calls(serial) == [[0xFF] * (84 * 48 // 8)]
+
+    # Clearing sends the same frame as displaying a blank image, so the
+    # latter is then skipped
+    device.clear()
+    serial.reset_mock()
+    device.display(Image.new("1", device.size))
+    serial.data.assert_not_called()
+
+
+def test_clear_always_sent():
+    device = pcd8544(serial, gpio=Mock(), framebuffer=page_diff())
+    serial.reset_mock()
+
+    # Even when already blank, clearing resynchronises the whole display
+    device.clear()
+    assert data_calls(serial) == [[0] * (84 * 48 // 8)]
+    assert device.skipped_frames == 0
+
+
+def test_encode_present():
+    device = pcd8544(serial, gpio=Mock(), rotate=1)
+    img = Image.new("1", device.size)
+    img.putpixel((0, 0), 1)
+
+    frame = device.encode(img)
+    assert frame.data == pages(img, 1)
+    with pytest.raises(AttributeError):
+        frame.data = b""
+
+    serial.reset_mock()
+    device.present(frame)
+    assert data_calls(serial) == [list(frame.data)]
+
+    # Displaying the same image is then skipped
+    serial.reset_mock()
+    device.display(img)
+    serial.data.assert_not_called()
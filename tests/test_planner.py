@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Tests for the :py:mod:`luma.lcd.planner` module.
+"""
+
+import random
+from unittest.mock import patch
+
+from PIL import Image
+
+from luma.core.framebuffer import diff_to_previous
+from luma.lcd.planner import window_planner
+
+
+def test_cost():
+    planner = window_planner(11, 3)
+    assert planner.cost((0, 0, 10, 2)) == 11 + 60
+
+
+def test_plan_nothing():
+    planner = window_planner(11, 3)
+    assert planner.plan([]) == []
+    assert planner.bytes_saved == 0
+
+
+def test_plan_merges_nearby():
+    planner = window_planner(11, 3)
+    # Two single pixels, a pixel apart: one 3x1 window costs 20 bytes,
+    # rather than 2 x 14
+    assert planner.plan([(0, 0, 1, 1), (2, 0, 3, 1)]) == [(0, 0, 3, 1)]
+    assert planner.last_plan == [(0, 0, 3, 1)]
+    assert planner.bytes_saved == 8
+
+
+def test_plan_keeps_distant_apart():
+    planner = window_planner(11, 3)
+    bboxes = [(0, 0, 1, 1), (100, 100, 101, 101)]
+    assert planner.plan(bboxes) == bboxes
+    assert planner.bytes_saved == 0
+
+
+def test_plan_drops_contained():
+    planner = window_planner(11, 3)
+    assert planner.plan([(0, 0, 50, 50), (10, 10, 20, 20), (30, 30, 30, 40)]) == [(0, 0, 50, 50)]
+    assert planner.bytes_saved == 11 + 300
+
+
+def test_plan_splits_overlapping():
+    planner = window_planner(11, 3)
+    # An L shape: the union would send a large empty corner, and sending
+    # both would send the shared 10x10 square twice
+    plan = planner.plan([(0, 0, 100, 10), (0, 0, 10, 100)])
+    assert plan == [(0, 0, 100, 10), (0, 10, 10, 100)]
+    assert planner.bytes_saved == 300
+
+
+def test_plan_merges_transitively():
+    planner = window_planner(11, 3)
+    plan = planner.plan([(0, 0, 1, 1), (4, 0, 5, 1), (2, 0, 3, 1)])
+    assert plan == [(0, 0, 5, 1)]
+
+
+def test_redraw():
+    planner = window_planner(11, 3)
+    framebuffer = diff_to_previous(num_segments=4)
+    image = Image.new("RGB", (20, 20))
+    assert list(planner.redraw(framebuffer, image)) == [(image, (0, 0, 20, 20))]
+
+    # Changes either side of a segment boundary are sent as one window,
+    # cropped from the full image
+    image = image.copy()
+    image.putpixel((9, 3), (255, 0, 0))
+    image.putpixel((11, 3), (0, 255, 0))
+    [(segment, bbox)] = planner.redraw(framebuffer, image)
+    assert bbox == (9, 3, 12, 4)
+    assert list(segment.tobytes()) == [255, 0, 0, 0, 0, 0, 0, 255, 0]
+
+
+def scattered_pixels(count, size=240, seed=1234):
+    rnd = random.Random(seed)
+    return [(x, y, x + 1, y + 1) for x, y in
+            ((rnd.randrange(size), rnd.randrange(size)) for _ in range(count))]
+
+
+def test_plan_many_regions_bounded_cost():
+    planner = window_planner(11, 3)
+    bboxes = scattered_pixels(600)
+
+    with patch.object(window_planner, "cost", autospec=True, side_effect=window_planner.cost) as cost:
+        windows = planner.plan(bboxes)
+
+    # Rather than comparing every pair, each region is weighed a fixed number
+    # of times, and scattered pixels are sent as they are
+    assert cost.call_count <= 3 * len(bboxes) + 1
+    assert windows == bboxes
+    assert planner.bytes_saved == 0
+
+
+def test_plan_many_regions_bounding_box():
+    planner = window_planner(11, 3)
+    # A dense cluster of pixels is cheaper to send as a single window
+    bboxes = [(x, y, x + 1, y + 1) for x in range(0, 20, 2) for y in range(0, 20, 2)]
+    assert planner.plan(bboxes) == [(0, 0, 19, 19)]
+    assert planner.bytes_saved == 100 * 14 - (11 + 19 * 19 * 3)
+
+
+def test_plan_max_regions():
+    planner = window_planner(11, 3, max_regions=1)
+    assert planner.plan([(0, 0, 1, 1), (2, 0, 3, 1)]) == [(0, 0, 3, 1)]
@@ -10,10 +10,12 @@ Tests for the :py:class:`luma.lcd.device.st7567` device.
 import pytest
 
 from luma.lcd.device import st7567
+from luma.lcd.framebuffer import page_diff
 from luma.core.render import canvas
+from PIL import Image
 
 from baseline_data import get_reference_data, primitives
-from helpers import serial, setup_function, assert_invalid_dimensions  # noqa: F401
+from helpers import serial, setup_function, assert_invalid_dimensions, data_calls  # noqa: F401
 from unittest.mock import Mock, call
 
 
@@ -33,7 +35,7 @@ def test_init_128x64():
 
     # Next 1024 are all data: zeros to clear the RAM
     # (1024 = 128 * 64 / 8)
-    serial.data.assert_has_calls([call([0] * 128)] * 8)
+    assert data_calls(serial)[-8:] == [[0] * 128] * 8
 
 
 def test_contrast():
@@ -43,6 +45,21 @@ def test_contrast():
         device.contrast(300)
 
 
+def test_invert_all_on_blank():
+    device = st7567(serial, gpio=Mock())
+    serial.reset_mock()
+    device.invert(True)
+    device.invert(False)
+    device.all_on(True)
+    device.all_on(False)
+    device.blank(True)
+    device.blank(False)
+    assert serial.command.call_args_list == [
+        call(0xA7), call(0xA6), call(0xA5), call(0xA4), call(0xAE), call(0xAF)
+    ]
+    serial.data.assert_not_called()
+
+
 def test_display():
     device = st7567(serial, gpio=Mock())
     serial.reset_mock()
@@ -50,7 +67,7 @@ def test_display():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -71,3 +88,165 @@ def test_display():
     # save_reference_data("demo_st7567", recordings)
 
     assert recordings == get_reference_data('demo_st7567')
+
+
+def test_display_partial_update():
+    fb = page_diff()
+    device = st7567(serial, gpio=Mock(), framebuffer=fb)
+    serial.reset_mock()
+
+    img = Image.new("1", device.size)
+    img.putpixel((30, 17), 1)
+    img.putpixel((31, 17), 1)
+    device.display(img)
+
+    # Only page 2 changed: column 30 is addressed, after the 4 column offset
+    serial.command.assert_called_once_with(0xB2, 0x02, 0x12)
+    assert data_calls(serial) == [[0x02, 0x02]]
+    assert fb.bytes_saved == (8 * 3 + 1024) - (3 + 2)
+
+    # An unchanged frame skips every page
+    serial.reset_mock()
+    device.display(img)
+    serial.command.assert_not_called()
+    serial.data.assert_not_called()
+
+
+def test_scroll():
+    device = st7567(serial, gpio=Mock())
+    serial.reset_mock()
+
+    img = Image.new("1", device.size)
+    img.putpixel((0, 63), 1)
+    device.scroll(img)
+
+    # Start line moves down a page, and the newly exposed bottom page is
+    # written to the physical page that scrolled off the top
+    serial.command.assert_has_calls([call(0x48), call(0xB0, 0x04, 0x10)])
+    assert data_calls(serial) == [[0x80] + [0] * 127]
+
+    # Subsequent frames account for the scrolled position
+    serial.reset_mock()
+    img.putpixel((0, 0), 1)
+    device.display(img)
+    serial.command.assert_has_calls([call(0xB0 | (page + 1) % 8, 0x04, 0x10) for page in range(8)])
+
+
+def test_init_rotated():
+    device = st7567(serial, gpio=Mock(), rotate=2)
+    serial.command.assert_has_calls([call(0xA3), call(0xA0), call(0xC8)])
+
+    # Flipped in hardware, so sent as drawn, without a column offset
+    img = Image.new("1", device.size)
+    img.putpixel((0, 0), 1)
+    serial.reset_mock()
+    device.display(img)
+    serial.command.assert_has_calls([call(0xB0, 0x00, 0x10)])
+    assert data_calls(serial)[0] == [0x01] + [0] * 127
+
+
+def test_scroll_down_rotated():
+    device = st7567(serial, gpio=Mock(), rotate=2)
+    serial.reset_mock()
+
+    img = Image.new("1", device.size)
+    device.scroll(img, pages=-2)
+
+    # The common scan direction is reversed too, so the start line moves as
+    # it would for an unrotated display
+    serial.command.assert_has_calls([call(0x70), call(0xB6, 0x00, 0x10), call(0xB7, 0x00, 0x10)])
+
+
+def test_scroll_keeps_shadow_copy():
+    device = st7567(serial, gpio=Mock(), framebuffer=page_diff())
+
+    img = Image.new("1", device.size)
+    img.putpixel((5, 0), 1)
+    device.display(img)
+
+    scrolled = Image.new("1", device.size)
+    scrolled.paste(img.crop((0, 8, 128, 64)), (0, 0))
+    scrolled.putpixel((9, 60), 1)
+    device.scroll(scrolled, pages=1)
+
+    # The row that scrolled off the top is no longer on display, and the
+    # newly exposed page has already been sent, so nothing else need be
+    serial.reset_mock()
+    device.display(scrolled)
+    serial.command.assert_not_called()
+    serial.data.assert_not_called()
+
+
+def test_scroll_then_display_blank():
+    device = st7567(serial, gpio=Mock())
+
+    img = Image.new("1", device.size)
+    img.putpixel((0, 30), 1)
+    device.display(img)
+
+    # The pixel is still held in display memory, a page higher, so blanking
+    # the display must not be skipped as a repeat of the scrolled image
+    blank = Image.new("1", device.size)
+    device.scroll(blank, pages=1)
+    serial.reset_mock()
+    device.display(blank)
+    assert data_calls(serial) == [[0] * 128] * 8
+    assert device.skipped_frames == 0
+
+
+def test_display_skips_unchanged_frame():
+    device = st7567(serial, gpio=Mock())
+    serial.reset_mock()
+
+    img = Image.new("1", device.size)
+    device.display(img)
+    serial.command.assert_not_called()
+    serial.data.assert_not_called()
+    assert device.skipped_frames == 1
+
+    img.putpixel((0, 0), 1)
+    device.display(img)
+    assert len(data_calls(serial)) == 8
+    assert device.skipped_frames == 1
+
+
+def test_fill_pages():
+    device = st7567(serial, gpio=Mock(), framebuffer=page_diff())
+    serial.reset_mock()
+
+    device.fill_pages(0xFF)
+    assert data_calls(serial) == [[0xFF] * 128] * 8
+
+    # Drawing the same needs no update, and clearing only what changed
+    serial.reset_mock()
+    device.display(Image.new("1", device.size, "white"))
+    serial.data.assert_not_called()
+
+    img = Image.new("1", device.size, "white")
+    img.putpixel((0, 0), 0)
+    device.display(img)
+    assert data_calls(serial) == [[0xFE]]
+
+
+def test_clear_always_sent():
+    device = st7567(serial, gpio=Mock(), framebuffer=page_diff())
+    serial.reset_mock()
+
+    # Even when already blank, clearing resynchronises the whole display
+    device.clear()
+    assert data_calls(serial) == [[0] * 128] * 8
+    assert device.skipped_frames == 0
+
+
+def test_encode_present():
+    device = st7567(serial, gpio=Mock(), framebuffer=page_diff())
+    img = Image.new("1", device.size)
+    img.putpixel((30, 17), 1)
+    frame = device.encode(img)
+    serial.reset_mock()
+
+    device.present(frame)
+
+    # Only the changed column is sent
+    serial.command.assert_called_once_with(0xB2, 0x02, 0x12)
+    assert data_calls(serial) == [[0x02]]
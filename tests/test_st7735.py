@@ -7,22 +7,26 @@
 Tests for the :py:class:`luma.lcd.device.st7735` device.
 """
 
+import tracemalloc
+
 import pytest
 
+import luma.core.error
 from luma.lcd.device import st7735
 from luma.core.render import canvas
 from luma.core.framebuffer import full_frame
+from PIL import Image
 
 from baseline_data import get_reference_data, primitives
-from helpers import serial, setup_function, assert_invalid_dimensions  # noqa: F401
-from unittest.mock import Mock
+from helpers import serial, setup_function, assert_invalid_dimensions, data_calls, fill_calls  # noqa: F401
+from unittest.mock import Mock, call
 
 
 def test_init_160x128():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -56,7 +60,7 @@ def test_init_160x128():
         {'command': [225]}, {'data': [15, 27, 15, 23, 51, 44, 41, 46, 48, 48, 57, 63, 0, 7, 3, 16]},
         {'command': [42]}, {'data': [0, 0, 0, 159]},
         {'command': [43]}, {'data': [0, 0, 0, 127]},
-        {'command': [44]}, {'data': [0] * (160 * 128 * 3)},
+        {'command': [44]}, *[{'data': d} for d in fill_calls([0] * 3, 160 * 128)],
         {'command': [41]}
     ]
 
@@ -65,7 +69,7 @@ def test_init_128x128():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -99,7 +103,7 @@ def test_init_128x128():
         {'command': [225]}, {'data': [15, 27, 15, 23, 51, 44, 41, 46, 48, 48, 57, 63, 0, 7, 3, 16]},
         {'command': [42]}, {'data': [0, 0, 0, 127]},
         {'command': [43]}, {'data': [0, 0, 0, 127]},
-        {'command': [44]}, {'data': [0] * (128 * 128 * 3)},
+        {'command': [44]}, *[{'data': d} for d in fill_calls([0] * 3, 128 * 128)],
         {'command': [41]}
     ]
 
@@ -108,7 +112,7 @@ def test_init_160x80():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -142,7 +146,7 @@ def test_init_160x80():
         {'command': [225]}, {'data': [15, 27, 15, 23, 51, 44, 41, 46, 48, 48, 57, 63, 0, 7, 3, 16]},
         {'command': [42]}, {'data': [0, 0, 0, 159]},
         {'command': [43]}, {'data': [0, 0, 0, 79]},
-        {'command': [44]}, {'data': [0] * (160 * 80 * 3)},
+        {'command': [44]}, *[{'data': d} for d in fill_calls([0] * 3, 160 * 80)],
         {'command': [41]}
     ]
 
@@ -159,7 +163,7 @@ def test_offsets():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -193,11 +197,36 @@ def test_offsets():
         {'command': [225]}, {'data': [15, 27, 15, 23, 51, 44, 41, 46, 48, 48, 57, 63, 0, 7, 3, 16]},
         {'command': [42]}, {'data': [0, 2, 0, 129]},
         {'command': [43]}, {'data': [0, 1, 0, 128]},
-        {'command': [44]}, {'data': [0] * (128 * 128 * 3)},
+        {'command': [44]}, *[{'data': d} for d in fill_calls([0] * 3, 128 * 128)],
         {'command': [41]}
     ]
 
 
+def test_init_rgb565():
+    st7735(serial, gpio=Mock(), framebuffer=full_frame(), pixel_format="rgb565")
+    serial.command.assert_any_call(58)
+    assert [5] in data_calls(serial)
+    expected = fill_calls([0] * 2, 160 * 128)
+    assert data_calls(serial)[-len(expected):] == expected
+
+
+def test_init_invalid_pixel_format():
+    with pytest.raises(luma.core.error.DeviceDisplayModeError) as ex:
+        st7735(serial, gpio=Mock(), pixel_format="rgb444")
+    assert "Unsupported pixel format: rgb444" in str(ex.value)
+
+
+def test_display_rgb565_bgr():
+    device = st7735(serial, gpio=Mock(), framebuffer=full_frame(), bgr=True, pixel_format="rgb565")
+    assert [0x68] in data_calls(serial)
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="red")
+
+    assert data_calls(serial)[-1] == [0xF8, 0x00] + [0] * (160 * 128 * 2 - 2)
+
+
 def test_contrast():
     device = st7735(serial, gpio=Mock())
     serial.reset_mock()
@@ -226,7 +255,7 @@ def test_display():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -247,3 +276,160 @@ def test_display():
     # save_reference_data("demo_st7735", recordings)
 
     assert recordings == get_reference_data('demo_st7735')
+
+
+def test_display_allocations():
+    device = st7735(serial, gpio=Mock(), framebuffer=full_frame())
+    frame = Image.new("RGB", device.size, "red")
+    frame_size = 160 * 128 * 3
+    device.display(frame)
+
+    tracemalloc.start()
+    try:
+        for _ in range(3):
+            serial.reset_mock()
+            device.display(frame)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # The pixel data goes straight to the serial interface as bytes, rather
+    # than being expanded into a list of ints (8 bytes per pointer alone)
+    assert isinstance(serial.data.call_args.args[0], bytes)
+    assert peak < frame_size * 2
+
+
+def test_hardware_rotate():
+    for rotate, madctl in enumerate([0x60, 0xC0, 0xA0, 0x00]):
+        serial.reset_mock()
+        device = st7735(serial, gpio=Mock(), rotate=rotate, framebuffer=full_frame(), hardware_rotate=True)
+        assert [madctl] in data_calls(serial)
+        assert device.rotate == 0
+        assert device.size == ((160, 128) if rotate % 2 == 0 else (128, 160))
+
+
+def test_display_hardware_rotate():
+    device = st7735(serial, gpio=Mock(), rotate=1, framebuffer=full_frame(), hardware_rotate=True)
+    serial.reset_mock()
+
+    frame = Image.new("RGB", device.size)
+    frame.putpixel((1, 2), (255, 0, 0))
+    device.display(frame)
+
+    # Sent as drawn, the window (in the rotated address space) being
+    # unchanged since the initial clear
+    serial.command.assert_called_once_with(0x2C)
+    assert data_calls(serial) == [list(frame.tobytes())]
+
+
+def test_display_skips_unchanged_window():
+    device = st7735(serial, gpio=Mock())
+    serial.reset_mock()
+
+    for _ in range(2):
+        with canvas(device) as draw:
+            draw.rectangle((10, 10, 19, 19), fill="red" if _ else "blue")
+
+    # The window is only addressed for the first update
+    assert serial.command.call_args_list == [call(0x2A), call(0x2B), call(0x2C), call(0x2C)]
+    assert data_calls(serial)[:2] == [[0, 10, 0, 19], [0, 10, 0, 19]]
+
+
+def test_blit():
+    device = st7735(serial, gpio=Mock())
+    serial.reset_mock()
+
+    sprite = Image.new("RGB", (4, 3), "red")
+    device.blit(sprite, (10, 20))
+
+    assert serial.command.call_args_list == [call(0x2A), call(0x2B), call(0x2C)]
+    assert data_calls(serial) == [[0, 10, 0, 13], [0, 20, 0, 22], [255, 0, 0] * 12]
+
+
+def test_blit_then_display():
+    device = st7735(serial, gpio=Mock())
+    device.blit(Image.new("RGB", (4, 3), "red"), (10, 20))
+    serial.reset_mock()
+
+    # Drawing what was blitted needs no update, but blanking it out does
+    with canvas(device) as draw:
+        draw.rectangle((10, 20, 13, 22), fill="red")
+    assert not serial.data.called
+
+    # The window is still addressed from the blit
+    device.display(Image.new("RGB", device.size))
+    serial.command.assert_called_once_with(0x2C)
+    assert data_calls(serial) == [[0, 0, 0] * 12]
+
+
+def test_blit_rotated():
+    for rotate in range(1, 4):
+        device = st7735(serial, gpio=Mock(), rotate=rotate, framebuffer=full_frame())
+        sprite = Image.new("RGB", (4, 3))
+        sprite.putpixel((0, 0), (255, 0, 0))
+        serial.reset_mock()
+
+        device.blit(sprite, (10, 20))
+
+        # The window and pixels match those of the sprite in a full frame
+        frame = Image.new("RGB", device.size)
+        frame.paste(sprite, (10, 20))
+        mask = Image.new("RGB", device.size)
+        mask.paste("white", (10, 20, 14, 23))
+        left, top, right, bottom = device.preprocess(mask).getbbox()
+
+        assert data_calls(serial) == [
+            [0, left, 0, right - 1],
+            [0, top, 0, bottom - 1],
+            list(device.preprocess(frame).crop((left, top, right, bottom)).tobytes())
+        ]
+
+
+def test_fill_rect():
+    device = st7735(serial, gpio=Mock())
+    serial.reset_mock()
+
+    device.fill_rect((10, 20, 110, 70), (0, 0, 255))
+
+    assert serial.command.call_args_list == [call(0x2A), call(0x2B), call(0x2C)]
+    assert data_calls(serial) == [[0, 10, 0, 109], [0, 20, 0, 69]] + fill_calls([0, 0, 255], 100 * 50)
+
+    # The framebuffer is kept in step, so drawing the same needs no update
+    serial.reset_mock()
+    with canvas(device) as draw:
+        draw.rectangle((10, 20, 109, 69), fill="blue")
+    assert not serial.data.called
+
+
+def test_fill_rect_rgb565_rotated():
+    device = st7735(serial, gpio=Mock(), rotate=1, pixel_format="rgb565")
+    serial.reset_mock()
+
+    device.fill_rect((0, 0, 128, 10), "red")
+
+    assert data_calls(serial) == [[0, 150, 0, 159], [0, 0, 0, 127]] + fill_calls([0xF8, 0x00], 128 * 10)
+
+
+def test_encode_present():
+    device = st7735(serial, gpio=Mock(), width=128, height=128, rotate=2, h_offset=2, v_offset=1,
+                    pixel_format="rgb565")
+    icon = Image.new("RGB", (2, 1), "red")
+    icon.putpixel((1, 0), (0, 0, 255))
+
+    frame = device.encode(icon, (10, 20))
+    assert frame.bbox == (116, 107, 118, 108)
+    assert frame.window == (118, 108, 120, 109)
+    assert frame.data == bytes([0x00, 0x1F, 0xF8, 0x00])
+
+    # The same frame can be presented any number of times
+    for _ in range(2):
+        serial.reset_mock()
+        device.present(frame)
+        assert data_calls(serial)[-1] == list(frame.data)
+
+    # ... and the framebuffer is kept in step
+    serial.reset_mock()
+    with canvas(device) as draw:
+        draw.point((10, 20), fill="red")
+        draw.point((11, 20), fill="blue")
+    assert not serial.data.called
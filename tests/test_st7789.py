@@ -9,11 +9,13 @@ Tests for the :py:class:`luma.lcd.device.st7789` device.
 import pytest
 
 from luma.lcd.device import st7789
+from luma.core.framebuffer import full_frame
 from luma.core.render import canvas
+from PIL import Image
 
 from baseline_data import get_reference_data, primitives
-from helpers import serial
-from unittest.mock import Mock
+from helpers import serial, data_calls, fill_calls
+from unittest.mock import Mock, call
 
 
 def test_init_240x240():
@@ -106,3 +108,141 @@ def test_display():
     # save_reference_data("demo_st7789", recordings)
 
     assert recordings == get_reference_data('demo_st7789')
+
+
+def test_display_partial_update():
+    device = st7789(serial, gpio=Mock())
+    serial.reset_mock()
+
+    recordings = []
+
+    def data(data):
+        recordings.extend(data)
+
+    def command(*cmd):
+        recordings.extend(['command', list(cmd)[0], 'data', *list(cmd)[1:]])
+
+    serial.command.side_effect = command
+    serial.data.side_effect = data
+
+    with canvas(device) as draw:
+        draw.rectangle((10, 20, 12, 300), fill="red")
+
+    assert recordings == [
+        'command', 42, 'data', 0, 10, 0, 12,
+        'command', 43, 'data', 0, 20, 0, 239,
+        'command', 44, 'data', *([255, 0, 0] * (3 * 220))
+    ]
+
+    # Nothing changed, so nothing is sent
+    serial.reset_mock()
+    with canvas(device) as draw:
+        draw.rectangle((10, 20, 12, 300), fill="red")
+    serial.command.assert_not_called()
+    serial.data.assert_not_called()
+
+
+def test_display_full_frame():
+    device = st7789(serial, gpio=Mock(), width=240, height=135, framebuffer=full_frame())
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+
+    # Same window as the initial clear, so only the memory write is needed
+    serial.command.assert_called_once_with(44)
+    assert len(data_calls(serial)[0]) == 240 * 135 * 3
+
+
+def test_init_rgb565():
+    serial.reset_mock()
+    st7789(serial, gpio=Mock(), pixel_format="rgb565")
+    assert data_calls(serial)[1] == [0x55]
+    expected = fill_calls([0] * 2, 240 * 240)
+    assert data_calls(serial)[-len(expected):] == expected
+
+
+def test_hardware_rotate():
+    serial.reset_mock()
+    device = st7789(serial, gpio=Mock(), width=240, height=135, rotate=3, hardware_rotate=True)
+    assert data_calls(serial)[0] == [0x10]
+    assert device.size == (135, 240)
+    clear = len(fill_calls([0] * 3, 135 * 240))
+    assert data_calls(serial)[-clear - 2:-clear] == [[0, 0, 0, 134], [0, 0, 0, 239]]
+
+
+@pytest.mark.parametrize("rotate, madctl, dx, dy", [
+    (0, 0x70, 0, 0),
+    # Reversing the 320 rows of display memory puts the panel at row 80
+    (1, 0xD0, 0, 80),
+    # ...which, with rows and columns exchanged, are the column addresses
+    (2, 0xB0, 80, 0),
+    (3, 0x10, 0, 0),
+])
+def test_hardware_rotate_window(rotate, madctl, dx, dy):
+    serial.reset_mock()
+    device = st7789(serial, gpio=Mock(), rotate=rotate, hardware_rotate=True)
+    assert data_calls(serial)[0] == [madctl]
+
+    # Cleared through a window over the whole panel
+    clear = len(fill_calls([0] * 3, 240 * 240))
+    assert data_calls(serial)[-clear - 2:-clear] == [
+        [0, dx, (dx + 239) >> 8, (dx + 239) & 0xFF],
+        [0, dy, (dy + 239) >> 8, (dy + 239) & 0xFF]]
+
+    serial.reset_mock()
+    with canvas(device) as draw:
+        draw.point((1, 2), fill="white")
+    assert data_calls(serial) == [[0, dx + 1, 0, dx + 1], [0, dy + 2, 0, dy + 2], [0xFF] * 3]
+
+
+@pytest.mark.parametrize("mode", ["1", "L", "RGBA"])
+def test_display_converts_mode(mode):
+    device = st7789(serial, gpio=Mock(), framebuffer=full_frame())
+    serial.reset_mock()
+
+    device.display(Image.new(mode, device.size, "white"))
+    assert data_calls(serial) == [[0xFF] * (240 * 240 * 3)]
+
+
+def test_display_skips_unchanged_frame():
+    device = st7789(serial, gpio=Mock(), framebuffer=full_frame())
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+
+    serial.command.assert_called_once_with(44)
+    assert device.skipped_frames == 1
+
+
+def test_blit_then_display_same_frame():
+    device = st7789(serial, gpio=Mock(), framebuffer=full_frame())
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+    device.blit(Image.new("RGB", (2, 2), "red"), (0, 0))
+    serial.reset_mock()
+
+    # The frame is the same as the last one displayed, but not what is
+    # shown any more
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+
+    assert serial.command.call_args_list[-1] == call(44)
+    assert device.skipped_frames == 0
+
+
+def test_display_skips_unchanged_frame_diff_to_previous():
+    device = st7789(serial, gpio=Mock())
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+
+    serial.command.assert_not_called()
+    assert device.skipped_frames == 1
+    assert device._last_frame is None
@@ -8,10 +8,12 @@ Tests for the :py:class:`luma.lcd.device.uc1701x` device.
 """
 
 from luma.lcd.device import uc1701x
+from luma.lcd.framebuffer import page_diff
 from luma.core.render import canvas
+from PIL import Image
 
 from baseline_data import get_reference_data, primitives
-from helpers import serial
+from helpers import serial, setup_function, data_calls  # noqa: F401
 from unittest.mock import Mock, call
 
 
@@ -50,7 +52,35 @@ def test_init_128x64():
 
     # Next 1024 are all data: zero's to clear the RAM
     # (1024 = 128 * 64 / 8)
-    serial.data.assert_has_calls([call([0] * 128)] * 8)
+    assert data_calls(serial)[-8:] == [[0] * 128] * 8
+
+
+def test_init_rotated():
+    device = uc1701x(serial, gpio=Mock(), rotate=2)
+    serial.command.assert_has_calls([call(0xA2), call(0xC8), call(0xA0)])
+    assert device.rotate == 0
+
+    img = Image.new("1", device.size)
+    img.putpixel((127, 63), 1)
+    serial.reset_mock()
+    device.display(img)
+    serial.command.assert_has_calls([call(0xB7, 0x00, 0x10)])
+    assert data_calls(serial)[7] == [0] * 127 + [0x80]
+
+
+def test_invert_all_on_blank():
+    device = uc1701x(serial, gpio=Mock())
+    serial.reset_mock()
+    device.invert(True)
+    device.invert(False)
+    device.all_on(True)
+    device.all_on(False)
+    device.blank(True)
+    device.blank(False)
+    assert serial.command.call_args_list == [
+        call(0xA7), call(0xA6), call(0xA5), call(0xA4), call(0xAE), call(0xAF)
+    ]
+    serial.data.assert_not_called()
 
 
 def test_display():
@@ -63,7 +93,7 @@ def test_display():
     recordings = []
 
     def data(data):
-        recordings.append({'data': data})
+        recordings.append({'data': list(data)})
 
     def command(*cmd):
         recordings.append({'command': list(cmd)})
@@ -84,3 +114,19 @@ def test_display():
     # save_reference_data("demo_uc1701x", recordings)
 
     assert recordings == get_reference_data('demo_uc1701x')
+
+
+def test_display_partial_update():
+    """
+    UC1701X LCD only sends the changed columns of changed pages.
+    """
+    device = uc1701x(serial, gpio=Mock(), framebuffer=page_diff())
+    serial.reset_mock()
+
+    img = Image.new("1", device.size)
+    img.putpixel((0, 63), 1)
+    img.putpixel((127, 63), 1)
+    device.display(img)
+
+    serial.command.assert_has_calls([call(0xB7, 0x04, 0x10), call(0xB7, 0x03, 0x18)])
+    assert data_calls(serial) == [[0x80], [0x80]]